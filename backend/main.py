@@ -1,16 +1,25 @@
 """FastAPI Backend for Resume Orchestrator Agents."""
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
+from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from pydantic import BaseModel
-from typing import Optional, List, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, ConfigDict, ValidationError, field_validator
+from typing import Optional, List, Dict, Any, Literal, Tuple
 import asyncio
+import orjson
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
 import sys
 from pathlib import Path
 import logging
-import uuid
-from concurrent.futures import ThreadPoolExecutor
+import secrets
+import hashlib
+import ipaddress
+from functools import lru_cache
+from itertools import islice
+from types import MappingProxyType
 
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -23,23 +32,167 @@ from src.agents.rewrite_tailor import RewriteTailorAgent
 from src.utils.jd_fetcher import JDFetcher
 from src.utils.resume_exporter import ResumeExporter
 from src.utils.job_fetcher import JobFetcher
+from src.utils.cache import TTLCache
+from src.utils.result_store import create_result_store
+from src.utils.openai_client import LoopBoundOpenAI
 from src.agents.profile_parser.profile_models import Profile
 from src.agents.job_understanding.jd_models import JobDescription
 from src.config import config
-from openai import OpenAI
+import httpx
 import tempfile
 import os
 import re
-
-openai_client = OpenAI(api_key=config.openai_api_key)
+import shutil
+import string
+from urllib.parse import urlparse
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Resume Orchestrator API")
+# Processes used to extract text from uploaded resumes
+RESUME_PARSE_WORKERS = int(os.getenv("RESUME_PARSE_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Keep upload and voice-download temp files in RAM when /dev/shm has room for them
+SHM_DIR = "/dev/shm"
+MIN_SHM_FREE_BYTES = 256 * 1024 * 1024
+
+
+def _configure_tempdir() -> str:
+    """Point tempfile at APP_TMPDIR, else /dev/shm if it has enough free space.
+
+    Falls back to the platform default temp dir so a small or missing
+    ramdisk never causes uploads to fail.
+    """
+    tmpdir = os.environ.get("APP_TMPDIR")
+    if not tmpdir and os.path.isdir(SHM_DIR):
+        try:
+            if shutil.disk_usage(SHM_DIR).free >= MIN_SHM_FREE_BYTES:
+                tmpdir = SHM_DIR
+        except OSError:
+            pass
+    if tmpdir:
+        tempfile.tempdir = tmpdir
+    logger.info("Using temp directory %s", tempfile.gettempdir())
+    return tempfile.gettempdir()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build the agents, fetchers and shared HTTP/OpenAI clients once per worker.
+
+    Done at startup rather than import time so that importing this module
+    (reload cycles, tests, tooling) stays cheap and each worker initializes
+    inside its own event loop.
+    """
+    _configure_tempdir()
+
+    # One OpenAI connection pool per worker, shared by every agent and route
+    app.state.openai = LoopBoundOpenAI()
+
+    orchestrator = CentralOrchestrator()
+    app.state.orchestrator = orchestrator
+    app.state.voice_agent = VoiceCaptureAgent(orchestrator, openai=app.state.openai)
+    # Resume text extraction (pdfplumber/python-docx) is CPU-bound pure
+    # Python, so it runs in worker processes instead of holding this GIL
+    app.state.parse_pool = ProcessPoolExecutor(max_workers=RESUME_PARSE_WORKERS)
+    app.state.profile_agent = ProfileParserAgent(
+        orchestrator, executor=app.state.parse_pool, openai=app.state.openai
+    )
+    app.state.jd_agent = JobUnderstandingAgent(orchestrator, openai=app.state.openai)
+    app.state.rewrite_agent = RewriteTailorAgent(orchestrator, openai=app.state.openai)
+
+    orchestrator.register_agent(app.state.voice_agent)
+    orchestrator.register_agent(app.state.profile_agent)
+    orchestrator.register_agent(app.state.jd_agent)
+    orchestrator.register_agent(app.state.rewrite_agent)
+
+    app.state.job_fetcher = JobFetcher()
+    app.state.jd_fetcher = JDFetcher()
+    app.state.resume_exporter = ResumeExporter()
+
+    app.state.job_results = create_result_store(
+        "job_results", config.redis_url, maxsize=RESULT_MAXSIZE, ttl=RESULT_TTL_SECONDS
+    )
+    app.state.upload_results = create_result_store(
+        "upload_results", config.redis_url, maxsize=RESULT_MAXSIZE, ttl=RESULT_TTL_SECONDS
+    )
+    app.state.parsed_resumes = create_result_store(
+        "parsed_resumes", config.redis_url, maxsize=PARSED_RESUME_MAXSIZE, ttl=PARSED_RESUME_TTL_SECONDS
+    )
+
+    app.state.http = httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+    )
+    try:
+        yield
+    finally:
+        await app.state.http.aclose()
+        await app.state.orchestrator.aclose()
+        await app.state.openai.aclose()
+        await app.state.job_results.close()
+        await app.state.upload_results.close()
+        await app.state.parsed_resumes.close()
+        app.state.parse_pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson.
+
+    Defined here because FastAPI's own ORJSONResponse is deprecated.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(
+    title="Resume Orchestrator API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+# Reject request bodies over 10 MB before they are read
+MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+
+
+@app.middleware("http")
+async def limit_request_size(request: Request, call_next):
+    """Short-circuit with 413 when Content-Length exceeds MAX_UPLOAD_BYTES.
+
+    Registered before CORS so the 413 still carries CORS headers. Chunked
+    uploads without a Content-Length are bounded in upload_resume instead.
+    """
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_UPLOAD_BYTES:
+        return JSONResponse(status_code=413, content={"detail": "Request body too large"})
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def handle_unexpected_errors(request: Request, call_next):
+    """Map any unhandled exception to a logged, generic 500 response.
+
+    Handlers raise HTTPException for expected failures and let everything
+    else propagate here instead of each wrapping its body in try/except.
+    Registered before CORS (unlike an Exception handler, which Starlette runs
+    outside all middleware) so the 500 still carries CORS headers.
+    """
+    try:
+        return await call_next(request)
+    except Exception:
+        logger.exception("Unhandled error on %s %s", request.method, request.url.path)
+        return JSONResponse(status_code=500, content={"detail": "Internal server error"})
+
+
+@app.exception_handler(ValidationError)
+async def validation_error_handler(request: Request, exc: ValidationError):
+    """Report invalid profile/job payloads as 422 rather than a server error."""
+    return JSONResponse(
+        status_code=422,
+        content={"detail": jsonable_encoder(exc.errors(include_url=False))},
+    )
 
-# Create thread pool executor for blocking operations
-executor = ThreadPoolExecutor(max_workers=4)
 
 # CORS middleware
 app.add_middleware(
@@ -50,28 +203,116 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize orchestrator and agents
-orchestrator = CentralOrchestrator()
-voice_agent = VoiceCaptureAgent(orchestrator)
-profile_agent = ProfileParserAgent(orchestrator)
-jd_agent = JobUnderstandingAgent(orchestrator)
-rewrite_agent = RewriteTailorAgent(orchestrator)
+# Compress JSON responses (job lists, parsed profiles) above 1 KB
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+# Cap concurrent upstream job-search calls across categories
+job_search_semaphore = asyncio.Semaphore(8)
+
+# Cap apply pipelines concurrently inside an LLM stage (JD analysis or
+# resume tailoring) so a burst of applications doesn't trigger OpenAI 429s
+llm_semaphore = asyncio.Semaphore(16)
+
+# Read uploads in 1 MiB chunks instead of buffering the whole file
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+DOCX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+# Audio downloads are streamed in 64 KiB chunks and capped at the
+# transcription API's 25 MB upload limit
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+MAX_AUDIO_BYTES = 25 * 1024 * 1024
+
+# Results of background uploads/jobs awaiting a poll (app.state.job_results /
+# app.state.upload_results, shared through Redis when REDIS_URL is set).
+# Entries are removed once a successful result is fetched; failed or
+# never-polled results expire after an hour, and at most 10,000 are kept
+# in-process.
+RESULT_TTL_SECONDS = 3600
+RESULT_MAXSIZE = 10_000
+
+# Parsed profiles keyed by SHA-256 of the uploaded file, kept for a day so
+# re-uploads of the same resume skip the LLM extraction
+PARSED_RESUME_TTL_SECONDS = 24 * 3600
+PARSED_RESUME_MAXSIZE = 256
 
-orchestrator.register_agent(voice_agent)
-orchestrator.register_agent(profile_agent)
-orchestrator.register_agent(jd_agent)
-orchestrator.register_agent(rewrite_agent)
+# Job result streams send a heartbeat this often while the job is pending and
+# close after the same 5 minutes the frontend used to poll for
+JOB_STREAM_HEARTBEAT_SECONDS = 15
+JOB_STREAM_MAX_SECONDS = 300
 
-job_fetcher = JobFetcher()
-jd_fetcher = JDFetcher()
-resume_exporter = ResumeExporter()
+# TTL-bounded caches for fetched JDs (keyed by URL) and JD analyses (keyed by
+# a hash of the JD text), so retries on the same job skip the fetch and LLM call
+_jd_fetch_cache = TTLCache(maxsize=1024, ttl=3600)
+_jd_analysis_cache = TTLCache(maxsize=1024, ttl=3600)
+# In-flight JD fetches keyed by URL (single-flight)
+_inflight_jd_fetches: Dict[str, asyncio.Future] = {}
 
-# Job processing queue to store results
-job_results = {}
-upload_results = {}
+# Instructions for custom LinkedIn messages. Kept identical across requests
+# (and sent first) so the provider can reuse its prompt cache for them.
+LINKEDIN_MESSAGE_SYSTEM_PROMPT = """You write concise, personalized LinkedIn referral request messages.
 
-# In-memory cache for employee lookups (keyed by lowercased company name)
-_employee_cache: Dict[str, list] = {}
+The user message gives the sender, the target role and company, the sender's
+experience and top skills, the message tone, any custom requirements, and the
+sign-off name.
+
+Rules:
+- Address the recipient as [Name] (placeholder)
+- Keep it genuine and human, not overly salesy
+- Apply the given tone and every custom requirement strictly
+- End with the given sign-off name
+- Return only the message text, no extra commentary"""
+
+# Template messages used when no custom requirements are given, keyed by
+# tone (anything unrecognized gets the concise one)
+_LINKEDIN_TEMPLATES = {
+    "professional": string.Template("""Hi [Name],
+
+I hope this message finds you well. I noticed that $company is hiring for the $job_title position, and I am very interested in this opportunity.
+
+With my background in $experience_title and expertise in $top_skills, I believe I would be a strong fit for this role and could contribute meaningfully to the team.
+
+I would greatly appreciate it if you could refer me for this position or connect me with the hiring manager. I have attached my resume and would be happy to discuss how my skills and experience align with the team's needs.
+
+Thank you for considering my request. I look forward to the possibility of working together.
+
+Best regards,
+$name"""),
+    "friendly": string.Template("""Hey [Name]!
+
+Hope you're doing well! I saw that $company is looking for a $job_title, and I'm really excited about this opportunity.
+
+I've been working in $experience_title and have experience with $top_skills. I think I'd be a great fit for the role and would love to be part of the team!
+
+Would you be able to refer me or point me in the right direction? I'd really appreciate any help you can offer. Happy to chat more about it if you'd like!
+
+Thanks so much!
+$name"""),
+    "concise": string.Template("""Hi [Name],
+
+I'm interested in the $job_title role at $company. With my experience in $experience_title and $top_skills, I believe I'd be a strong candidate.
+
+Would you be able to refer me or connect me with the hiring team?
+
+Thanks,
+$name"""),
+}
+
+# Generated LinkedIn messages keyed by a hash of the full prompt, so repeat
+# requests (same job, profile, tone and requirements) skip the LLM call
+LINKEDIN_MESSAGE_TTL_SECONDS = 24 * 3600
+_linkedin_message_cache = TTLCache(maxsize=1024, ttl=LINKEDIN_MESSAGE_TTL_SECONDS)
+
+# Validated profiles keyed by a digest of the profile JSON, so repeat exports
+# and LinkedIn messages for the same profile skip validation. Only bodies up to
+# PROFILE_CACHE_MAX_BYTES are cached, which bounds the cache to roughly
+# PROFILE_CACHE_MAXSIZE * PROFILE_CACHE_MAX_BYTES of profile data
+PROFILE_CACHE_MAXSIZE = 128
+PROFILE_CACHE_MAX_BYTES = 256 * 1024
+_profile_cache = TTLCache(maxsize=PROFILE_CACHE_MAXSIZE, ttl=3600)
+
+# In-flight apply pipelines keyed by request fingerprint (single-flight)
+_inflight_jobs: Dict[str, asyncio.Future] = {}
 
 # Hardcoded employee profiles for common companies.
 # avatars: i.pravatar.cc (free, no auth). linkedin_url: company page (no fake personal URLs).
@@ -90,13 +331,6 @@ _HARDCODED_EMPLOYEES: Dict[str, list] = {
         {"name": "Aisha Patel",   "title": "Research Scientist",       "avatar_url": "https://i.pravatar.cc/48?img=56", "linkedin_url": "https://www.linkedin.com/company/google/"},
         {"name": "Ryan Lee",      "title": "Engineering Lead",         "avatar_url": "https://i.pravatar.cc/48?img=18", "linkedin_url": "https://www.linkedin.com/company/google/"},
     ],
-    "alphabet": [
-        {"name": "Alex Johnson",  "title": "Software Engineer III",   "avatar_url": "https://i.pravatar.cc/48?img=3",  "linkedin_url": "https://www.linkedin.com/company/google/"},
-        {"name": "Lisa Park",     "title": "Staff Engineer",           "avatar_url": "https://i.pravatar.cc/48?img=25", "linkedin_url": "https://www.linkedin.com/company/google/"},
-        {"name": "James Martinez","title": "Product Manager",          "avatar_url": "https://i.pravatar.cc/48?img=8",  "linkedin_url": "https://www.linkedin.com/company/google/"},
-        {"name": "Aisha Patel",   "title": "Research Scientist",       "avatar_url": "https://i.pravatar.cc/48?img=56", "linkedin_url": "https://www.linkedin.com/company/google/"},
-        {"name": "Ryan Lee",      "title": "Engineering Lead",         "avatar_url": "https://i.pravatar.cc/48?img=18", "linkedin_url": "https://www.linkedin.com/company/google/"},
-    ],
     "meta": [
         {"name": "Jordan Williams","title": "Software Engineer",       "avatar_url": "https://i.pravatar.cc/48?img=61", "linkedin_url": "https://www.linkedin.com/company/meta/"},
         {"name": "Mei Lin",        "title": "ML Engineer",             "avatar_url": "https://i.pravatar.cc/48?img=37", "linkedin_url": "https://www.linkedin.com/company/meta/"},
@@ -197,39 +431,54 @@ _HARDCODED_EMPLOYEES: Dict[str, list] = {
     ],
 }
 
+# Other names for the companies above (as produced by _normalize_company_name,
+# lowercased), so each lookup is a single probe on the canonical key
+_COMPANY_ALIASES: Dict[str, str] = {
+    "alphabet": "google",
+    "facebook": "meta",
+    "meta platforms": "meta",
+    "amazon web services": "amazon",
+    "aws": "amazon",
+    "jpmorgan chase": "jpmorgan",
+    "jp morgan": "jpmorgan",
+    "j.p. morgan": "jpmorgan",
+    "mastercard incorporated": "mastercard",
+}
+
+# Frozen view of the table above: employee lists are shared tuples of
+# read-only mappings, so lookups can hand out references without callers
+# being able to mutate the table; unknown companies are rejected with a set
+# probe before any dict lookup
+_HARDCODED_EMPLOYEES_IMMUTABLE: Dict[str, tuple] = {
+    k: tuple(MappingProxyType(employee) for employee in v) for k, v in _HARDCODED_EMPLOYEES.items()
+}
+_HARDCODED_KEYS = frozenset(_HARDCODED_EMPLOYEES_IMMUTABLE)
+
+_unknown_alias_targets = set(_COMPANY_ALIASES.values()) - _HARDCODED_KEYS
+if _unknown_alias_targets:
+    raise RuntimeError(f"Company aliases point at unknown companies: {sorted(_unknown_alias_targets)}")
+
 # Legal entity suffixes that LinkedIn does not index under
 _LEGAL_SUFFIXES = re.compile(
-    r"(?:"
+    r"(?:(?:"
     # Suffixes that appear after a space/comma (e.g. "Amazon.com Services LLC")
     r",?\s+(?:Inc\.?|LLC\.?|Ltd\.?|Corp\.?|Corporation|Limited"
     r"|Services\s+LLC|Services\s+Inc\.?"
     r"|Platforms?,?\s+Inc\.?|Technologies?,?\s+Inc\.?"
     r"|Group,?\s+Inc\.?|Holdings?,?\s+Inc\.?"
-    r"|Co\.?|L\.P\.?|LP|PLC|GmbH|S\.A\.?)"
-    # .com can be attached directly (e.g. "Amazon.com" after prior stripping)
+    r"|(?:&\s*)?Co\.?|L\.P\.?|LP|PLC|GmbH|S\.A\.?)"
+    # .com can be attached directly (e.g. "Amazon.com")
     r"|\.com"
-    r")\s*$",
-    re.IGNORECASE,
+    # Stacked suffixes ("Amazon.com Services LLC") are stripped in one match
+    r")[\s,]*)+$",
+    # Names are whitespace-normalised to ASCII spaces before matching, so the
+    # cheaper ASCII-only case folding is sufficient
+    re.IGNORECASE | re.ASCII,
 )
+_TRAILING_JUNK = string.whitespace + ","
 
 
-def _construct_linkedin_company_url(name: str) -> str:
-    """Derive a LinkedIn company URL directly from the normalised company name.
-
-    LinkedIn slugs are the lowercased name with spaces/punctuation replaced by
-    hyphens, e.g.:
-        'Amazon'           → https://www.linkedin.com/company/amazon/
-        'Mastercard'       → https://www.linkedin.com/company/mastercard/
-        'Goldman Sachs'    → https://www.linkedin.com/company/goldman-sachs/
-        'Amazon Web Services' → https://www.linkedin.com/company/amazon-web-services/
-    """
-    slug = name.lower()
-    slug = re.sub(r"[^a-z0-9\s-]", "", slug)   # keep letters, digits, spaces, hyphens
-    slug = re.sub(r"[\s]+", "-", slug)           # spaces → hyphens
-    slug = slug.strip("-")
-    return f"https://www.linkedin.com/company/{slug}/"
-
-
+@lru_cache(maxsize=4096)
 def _normalize_company_name(name: str) -> str:
     """Strip common legal entity suffixes so Proxycurl can match the brand name.
 
@@ -238,167 +487,388 @@ def _normalize_company_name(name: str) -> str:
         'Meta Platforms, Inc.'     → 'Meta'
         'Alphabet Inc.'            → 'Alphabet'
         'X Corp.'                  → 'X'
+        'JPMorgan Chase & Co.'     → 'JPMorgan Chase'
+
+    Results are memoised since the same employer names recur across requests.
     """
-    # Iteratively remove suffixes until the name stabilises (handles stacked suffixes)
-    prev = None
-    result = name.strip()
-    while result != prev:
-        prev = result
-        result = _LEGAL_SUFFIXES.sub("", result).strip().rstrip(",").strip()
-    return result or name.strip()
+    stripped = " ".join(name.split())
+    return _LEGAL_SUFFIXES.sub("", stripped, count=1).rstrip(_TRAILING_JUNK) or stripped
 
 
-def fetch_linkedin_employees(company_name: str, company_url: Optional[str] = None) -> list:
+@lru_cache(maxsize=4096)
+def _canonical_company_key(company_name: str) -> str:
+    """Map a raw company name to its _HARDCODED_EMPLOYEES key (or an unknown key)."""
+    lowered = _normalize_company_name(company_name).lower()
+    return _COMPANY_ALIASES.get(lowered, lowered)
+
+
+def fetch_linkedin_employees(company_name: str, company_url: Optional[str] = None) -> tuple:
     """Return up to 5 hardcoded employees for well-known companies (sync, cached).
 
     Uses a local lookup table so no external API call is made.
-    Returns [] for unknown companies — the frontend section stays hidden gracefully.
+    Returns () for unknown companies — the frontend section stays hidden gracefully.
     """
-    normalized_name = _normalize_company_name(company_name)
-    if normalized_name != company_name:
-        logger.info("Normalised company name: %r → %r", company_name, normalized_name)
-
-    cache_key = normalized_name.lower()
-    if cache_key in _employee_cache:
-        return _employee_cache[cache_key]
-
-    employees = _HARDCODED_EMPLOYEES.get(cache_key, [])
-    _employee_cache[cache_key] = employees
-    if employees:
-        logger.info("Returning hardcoded employees for %r (%d profiles)", normalized_name, len(employees))
-    else:
-        logger.info("No hardcoded employees for %r – section will be hidden", normalized_name)
+    cache_key = _canonical_company_key(company_name)
+    employees = _HARDCODED_EMPLOYEES_IMMUTABLE[cache_key] if cache_key in _HARDCODED_KEYS else ()
+
+    if logger.isEnabledFor(logging.INFO):
+        normalized_name = _normalize_company_name(company_name)
+        if normalized_name != company_name:
+            logger.info("Normalised company name: %r → %r", company_name, normalized_name)
+        if employees:
+            logger.info("Returning hardcoded employees for %r (%d profiles)", normalized_name, len(employees))
+        else:
+            logger.info("No hardcoded employees for %r – section will be hidden", normalized_name)
     return employees
 
 
-async def process_resume_background(upload_id: str, tmp_path: str):
-    """Process resume upload in background and store results."""
+def _single_flight(inflight: Dict[str, asyncio.Future], key: str, start) -> asyncio.Future:
+    """Return the in-flight future for *key*, starting ``start()`` if there is none.
+
+    The future is dropped from *inflight* as soon as it resolves, so every
+    caller that arrives while it runs shares its outcome (success or
+    failure) and the next caller after that starts a fresh run. Callers
+    should await it through asyncio.shield so one caller's cancellation
+    does not cancel the shared work.
+    """
+    future = inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(start())
+        inflight[key] = future
+        future.add_done_callback(
+            lambda done: inflight.pop(key) if inflight.get(key) is done else None
+        )
+    return future
+
+
+async def _fetch_and_cache_jd(url: str) -> Dict[str, Any]:
+    """Fetch a JD by URL and cache it if the fetch succeeded."""
+    result = await app.state.jd_fetcher.fetch_async(url, app.state.http)
+    if result.get("success"):
+        _jd_fetch_cache[url] = result
+    return result
+
+
+async def _cached_jd_fetch(url: str) -> Dict[str, Any]:
+    """Fetch a JD by URL, reusing successful results from the TTL cache.
+
+    Concurrent requests for the same URL share one fetch.
+    """
+    cached = _jd_fetch_cache.get(url)
+    if cached is not None:
+        return cached
+    future = _single_flight(_inflight_jd_fetches, url, lambda: _fetch_and_cache_jd(url))
+    return await asyncio.shield(future)
+
+
+def _etag_response(request: Request, payload: Dict[str, Any]) -> Response:
+    """Serialize *payload* as JSON with an ETag, honouring If-None-Match.
+
+    Returns a 304 with no body when the client already holds this version.
+    """
+    body = orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+
+    if_none_match = request.headers.get("if-none-match", "")
+    client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if etag in client_etags or "*" in client_etags:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _profile_from_json(payload: bytes) -> Profile:
+    """Validate a Profile from JSON bytes, reusing the result for repeat payloads.
+
+    Users typically export or message with the same profile many times, so
+    identical small payloads skip validation. The returned Profile is shared
+    between requests and must be treated as read-only.
+    """
+    if len(payload) > PROFILE_CACHE_MAX_BYTES:
+        return Profile.model_validate_json(payload)
+
+    key = hashlib.blake2b(payload, digest_size=16).digest()
+    profile = _profile_cache.get(key)
+    if profile is None:
+        profile = Profile.model_validate_json(payload)
+        _profile_cache[key] = profile
+    return profile
+
+
+def _safe_unlink(path: str) -> None:
+    """Delete a temp file, ignoring only the case where it is already gone."""
     try:
-        # Parse resume
-        result = await profile_agent.parse_resume(tmp_path)
-        
-        # Clean up temp file
-        os.unlink(tmp_path)
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+def _copy_upload(src, dst, limit: int) -> Tuple[int, str]:
+    """Copy *src* to *dst* in UPLOAD_CHUNK_SIZE chunks.
+
+    Returns the bytes read and the SHA-256 hex digest of what was copied.
+    Stops as soon as more than *limit* bytes have been read, so the caller
+    can reject oversize files without writing them out in full.
+    """
+    written = 0
+    digest = hashlib.sha256()
+    while chunk := src.read(UPLOAD_CHUNK_SIZE):
+        written += len(chunk)
+        if written > limit:
+            break
+        dst.write(chunk)
+        digest.update(chunk)
+    dst.flush()
+    return written, digest.hexdigest()
+
+
+async def _check_public_url(url: str) -> str:
+    """Reject URLs that are not http(s) or that resolve to a non-public address.
+
+    Audio URLs come from the client and are fetched by the server, so they
+    must not reach loopback, private or link-local hosts. Returns the vetted
+    address, which the caller must connect to: resolving the name again
+    would let a DNS-rebinding host answer with a private address the
+    second time.
+    """
+    parsed = urlparse(url)
+    if parsed.scheme not in ("http", "https") or not parsed.hostname:
+        raise ValueError("Audio URL must be an http or https URL")
+
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    try:
+        infos = await asyncio.get_running_loop().getaddrinfo(parsed.hostname, port)
+    except OSError as e:
+        raise ValueError(f"Could not resolve audio URL host: {parsed.hostname}") from e
+    for info in infos:
+        address = ipaddress.ip_address(info[4][0])
+        if not address.is_global:
+            raise ValueError("Audio URL must point to a public host")
+    return infos[0][4][0]
+
+
+async def _download_to_tempfile(url: str, client: httpx.AsyncClient) -> str:
+    """Stream *url* to a temp file in fixed-size chunks and return its path.
+
+    Memory use stays O(chunk) regardless of the download size. Downloads
+    larger than MAX_AUDIO_BYTES are rejected. The request goes to the
+    address vetted by _check_public_url, with the original Host header and
+    TLS server name, and redirects are not followed, so the host checked is
+    the one fetched.
+    """
+    address = await _check_public_url(url)
+    parsed = urlparse(url)
+    host = f"[{address}]" if ":" in address else address
+    pinned_url = parsed._replace(netloc=host if parsed.port is None else f"{host}:{parsed.port}").geturl()
+    headers = {"Host": parsed.netloc.rpartition("@")[2]}
+    extensions = {"sni_hostname": parsed.hostname} if parsed.scheme == "https" else {}
+
+    suffix = Path(parsed.path).suffix or ".wav"
+    async with client.stream(
+        "GET", pinned_url, headers=headers, extensions=extensions, timeout=30
+    ) as response:
+        response.raise_for_status()
+        tmp = await asyncio.to_thread(tempfile.NamedTemporaryFile, delete=False, suffix=suffix)
+        try:
+            written = 0
+            async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                written += len(chunk)
+                if written > MAX_AUDIO_BYTES:
+                    raise ValueError("Audio file exceeds the 25 MB transcription limit")
+                await asyncio.to_thread(tmp.write, chunk)
+            await asyncio.to_thread(tmp.close)
+        except BaseException:
+            tmp.close()
+            _safe_unlink(tmp.name)
+            raise
+        return tmp.name
+
+
+async def process_resume_background(upload_id: str, tmp_path: str, content_hash: str):
+    """Process resume upload in background and store results.
+
+    Successful parses are cached by file content hash, so re-uploading the
+    same file skips the LLM extraction.
+    """
+    try:
+        profile_dict = await app.state.parsed_resumes.get(content_hash)
+        if profile_dict is not None:
+            logger.info("Upload %s matches a previously parsed resume", upload_id)
+            result = {"success": True}
+        else:
+            # Parse resume
+            result = await app.state.profile_agent.parse_resume(tmp_path)
+            if result["success"]:
+                # Convert Profile to dict for JSON response
+                profile_dict = result["profile"].model_dump(mode="json")
+                await app.state.parsed_resumes.set(content_hash, profile_dict)
         
         if result["success"]:
-            # Convert Profile to dict for JSON response
-            profile_dict = result["profile"].model_dump()
-            upload_results[upload_id] = {
+            await app.state.upload_results.set(upload_id, {
                 "success": True,
                 "profile": profile_dict,
                 "message": "Resume parsed successfully"
-            }
+            })
         else:
-            upload_results[upload_id] = {
+            await app.state.upload_results.set(upload_id, {
                 "success": False,
                 "error": result.get("error", "Failed to parse resume")
-            }
+            })
     
     except Exception as e:
-        logger.error(f"Error processing resume {upload_id}: {e}")
-        # Clean up temp file on error
-        try:
-            os.unlink(tmp_path)
-        except:
-            pass
-        upload_results[upload_id] = {"success": False, "error": str(e)}
+        logger.error("Error processing resume %s: %s", upload_id, e)
+        await app.state.upload_results.set(upload_id, {"success": False, "error": str(e)})
+    
+    finally:
+        # Clean up temp file whether parsing succeeded or not
+        await asyncio.to_thread(_safe_unlink, tmp_path)
 
 
-async def process_job_background(job_id: str, request: Dict[str, Any]):
-    """Process job in background and store results."""
+async def _run_job_pipeline(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Run fetch → analyse → customize for one apply request and return its result."""
     try:
         # Extract data from request
         profile_data = request.get('profile_data')
         if not profile_data:
-            job_results[job_id] = {"success": False, "error": "Profile data required"}
-            return
-        
-        # Reconstruct Profile from dict
-        profile = Profile(**profile_data)
+            return {"success": False, "error": "Profile data required"}
         
         # Get job description
         job_url = request.get('job_url')
         job_description = request.get('job_description')
-        jd_text = None
-        
-        # Try to fetch from URL first
-        if job_url:
-            try:
-                result = jd_fetcher.fetch(job_url)
-                if result["success"]:
-                    jd_text = result["text"]
-                    logger.info(f"Successfully fetched JD from URL: {len(jd_text)} characters")
-            except Exception as e:
-                logger.warning(f"Failed to fetch from URL {job_url}: {e}")
         
-        # Fallback to job_description if URL fetch failed
-        if not jd_text and job_description:
-            jd_text = job_description
-            logger.info(f"Using provided job description: {len(jd_text)} characters")
+        async def build_profile(_deps):
+            # Reconstruct Profile from dict
+            return await asyncio.to_thread(Profile, **profile_data)
         
-        # If still no JD text, try to get from job data in request
-        if not jd_text:
+        async def resolve_jd_text(_deps):
+            # Try to fetch from URL first
+            if job_url:
+                try:
+                    fetch_result = await _cached_jd_fetch(job_url)
+                    if fetch_result["success"]:
+                        jd_text = fetch_result["text"]
+                        logger.info("Successfully fetched JD from URL: %d characters", len(jd_text))
+                        return jd_text
+                except Exception as e:
+                    logger.warning("Failed to fetch from URL %s: %s", job_url, e)
+            
+            # Fallback to job_description if URL fetch failed
+            if job_description:
+                logger.info("Using provided job description: %d characters", len(job_description))
+                return job_description
+            
+            # If still no JD text, try to get from job data in request
             job_data = request.get('job', {})
             if isinstance(job_data, dict) and job_data.get('description'):
                 jd_text = job_data['description']
-                logger.info(f"Using job description from job data: {len(jd_text)} characters")
+                logger.info("Using job description from job data: %d characters", len(jd_text))
+                return jd_text
+            return None
         
-        if not jd_text:
-            job_results[job_id] = {"success": False, "error": "No job description available"}
-            return
+        async def analyze_jd(deps):
+            # Analyze JD - reuse a cached analysis of identical text
+            jd_text = deps["jd_text"]
+            if not jd_text:
+                return None
+            analysis_key = hashlib.sha256(jd_text.encode("utf-8")).hexdigest()[:16]
+            jd_analysis = _jd_analysis_cache.get(analysis_key)
+            if jd_analysis is None:
+                async with llm_semaphore:
+                    jd_analysis = await app.state.jd_agent.process(
+                        input_data=None,
+                        jd_text=jd_text,
+                        jd_url=job_url
+                    )
+                _jd_analysis_cache[analysis_key] = jd_analysis
+            else:
+                logger.info("Using cached JD analysis for %s", analysis_key)
+            return jd_analysis
         
-        # Analyze JD - run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        jd_analysis = await loop.run_in_executor(
-            executor,
-            lambda: asyncio.run(jd_agent.process(
-                input_data=None,
-                jd_text=jd_text,
-                jd_url=job_url
-            ))
-        )
+        # Profile reconstruction is independent of the JD, so it overlaps
+        # with fetching and analysing the JD; each step starts as soon as
+        # its inputs are ready
+        results = await app.state.orchestrator.execute_dag({
+            "profile": {"run": build_profile},
+            "jd_text": {"run": resolve_jd_text},
+            "jd_analysis": {"run": analyze_jd, "depends_on": ["jd_text"]},
+        })
+        profile = results["profile"]
+        jd_analysis = results["jd_analysis"]
+        
+        if jd_analysis is None:
+            return {"success": False, "error": "No job description available"}
         
-        # Customize resume - run in thread pool to avoid blocking
-        result = await loop.run_in_executor(
-            executor,
-            lambda: asyncio.run(rewrite_agent.customize_resume(
+        # Customize resume - the agent's LLM calls are async, so await directly
+        async with llm_semaphore:
+            result = await app.state.rewrite_agent.customize_resume(
                 profile=profile,
                 jd=jd_analysis,
                 company_name=None,
                 job_role=None
-            ))
-        )
+            )
         
         if result["success"]:
-            edited_profile_dict = result["edited_profile"].model_dump()
+            edited_profile_dict = result["edited_profile"].model_dump(mode="json")
             
-            # Calculate changes made
+            # Calculate changes made, reading from the dump built above
+            experiences = edited_profile_dict["experiences"]
+            projects = edited_profile_dict["projects"]
             changes_summary = {
-                "summary_changed": profile.summary != result["edited_profile"].summary,
-                "experiences_edited": len([e for e in result["edited_profile"].experiences if e.bullets]),
-                "projects_edited": len([p for p in result["edited_profile"].projects if p.bullets]),
-                "skills_added": len(result["edited_profile"].skills) - len(profile.skills),
+                "summary_changed": profile.summary != edited_profile_dict["summary"],
+                "experiences_edited": sum(1 for e in experiences if e["bullets"]),
+                "projects_edited": sum(1 for p in projects if p["bullets"]),
+                "skills_added": len(edited_profile_dict["skills"]) - len(profile.skills),
             }
             
-            job_results[job_id] = {
+            required_skills = jd_analysis.required_skills
+            return {
                 "success": True,
                 "edited_profile": edited_profile_dict,
                 "jd_analysis": {
                     "title": jd_analysis.title,
                     "company": jd_analysis.company,
-                    "required_skills": [s.skill for s in jd_analysis.required_skills[:10]],
+                    "required_skills": [s.skill for s in islice(required_skills, 10)],
                     "ats_keywords": jd_analysis.ats_keywords[:20]
                 },
                 "changes_summary": changes_summary
             }
         else:
             error_msg = result.get("error", "Failed to customize resume")
-            logger.error(f"Resume customization failed: {error_msg}")
-            job_results[job_id] = {"success": False, "error": error_msg}
+            logger.error("Resume customization failed: %s", error_msg)
+            return {"success": False, "error": error_msg}
     
     except Exception as e:
-        logger.error(f"Error processing job {job_id}: {e}")
-        job_results[job_id] = {"success": False, "error": str(e)}
+        logger.error("Error processing job: %s", e)
+        return {"success": False, "error": str(e)}
+
+def _job_fingerprint(request: Dict[str, Any]) -> str:
+    """Hash the inputs that determine an apply request's result."""
+    job = request.get('job')
+    payload = orjson.dumps(
+        [
+            request.get('profile_data'),
+            request.get('job_url'),
+            request.get('job_description'),
+            job.get('description') if isinstance(job, dict) else None,
+        ],
+        option=orjson.OPT_SORT_KEYS,
+        default=str,
+    )
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+async def process_job_background(job_id: str, request: Dict[str, Any]):
+    """Process job in background and store results.
+
+    Identical requests that arrive while one is still running share its
+    result instead of repeating the LLM work (single-flight).
+    """
+    key = _job_fingerprint(request)
+    if key in _inflight_jobs:
+        logger.info("Job %s joined an identical in-flight request", job_id)
+    future = _single_flight(_inflight_jobs, key, lambda: _run_job_pipeline(request))
+    
+    await app.state.job_results.set(job_id, await asyncio.shield(future))
 
 
 # Pydantic models for requests
@@ -412,7 +882,8 @@ class EmployeeSearchRequest(BaseModel):
 
 
 class JobSearchRequest(BaseModel):
-    category: str
+    category: Optional[str] = None
+    categories: List[str] = []
     location: Optional[str] = None
     hours_ago: int = 36
 
@@ -428,20 +899,67 @@ class VoiceInstructionRequest(BaseModel):
     text: Optional[str] = None
 
 
+class LinkedInJob(BaseModel):
+    # Any other job fields the frontend sends are accepted and ignored
+    model_config = ConfigDict(extra="allow")
+
+    title: str = 'this position'
+    company: str = 'your company'
+
+    @field_validator('title', 'company', mode='before')
+    @classmethod
+    def _default_when_null(cls, value, info):
+        # Explicit nulls get the same wording as missing fields; anything else
+        # is formatted into the message as-is, like the old dict lookup did
+        return cls.model_fields[info.field_name].default if value is None else str(value)
+
+
+class LinkedInMessageRequest(BaseModel):
+    job: Optional[LinkedInJob] = None
+    profile: Optional[Dict[str, Any]] = None
+    tone: Literal['professional', 'friendly', 'concise'] = 'professional'
+    custom_requirements: str = ''
+
+    @field_validator('tone', mode='before')
+    @classmethod
+    def _concise_when_unknown(cls, value):
+        # Unrecognized tones fall back to the concise template
+        return value if isinstance(value, str) and value in _LINKEDIN_TEMPLATES else 'concise'
+
+
+class InterviewPrepRequest(BaseModel):
+    job: Optional[Dict[str, Any]] = None
+
+
 # API Routes
 @app.get("/")
 async def root():
     return {"message": "Resume Orchestrator API", "status": "running"}
 
 
+@app.get("/metrics")
+async def metrics():
+    """Report size and hit/miss counts of the in-process caches."""
+    return {
+        "job_results": app.state.job_results.stats(),
+        "upload_results": app.state.upload_results.stats(),
+        "parsed_resumes": app.state.parsed_resumes.stats(),
+        "jd_fetch": _jd_fetch_cache.stats(),
+        "jd_analysis": _jd_analysis_cache.stats(),
+        "linkedin_messages": _linkedin_message_cache.stats(),
+        "profiles": _profile_cache.stats(),
+    }
+
+
 @app.post("/api/jd/fetch")
-def fetch_jd_preview(request: JDFetchRequest):
+async def fetch_jd_preview(request: JDFetchRequest):
     """Fetch and preview a job description from a URL before queuing.
 
-    Uses a sync def route so FastAPI runs it in a thread pool, avoiding
-    event-loop blocking from the underlying requests.get() calls.
+    Fetches over the shared async HTTP client, so previews don't occupy the
+    thread pool used by uploads, and goes through the JD cache so applying
+    to the previewed job skips a second fetch.
     """
-    result = jd_fetcher.fetch(request.url)
+    result = await _cached_jd_fetch(request.url)
     if not result.get("success"):
         raise HTTPException(
             status_code=422,
@@ -459,420 +977,463 @@ def fetch_jd_preview(request: JDFetchRequest):
 @app.post("/api/resume/upload")
 async def upload_resume(file: UploadFile = File(...), background_tasks: BackgroundTasks = None):
     """Upload and parse resume (non-blocking)."""
-    try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-        
-        # Generate unique upload ID
-        upload_id = str(uuid.uuid4())
-        
-        # Start background processing
-        if background_tasks:
-            background_tasks.add_task(process_resume_background, upload_id, tmp_path)
-        else:
-            # Fallback for testing without background tasks
-            import asyncio
-            asyncio.create_task(process_resume_background(upload_id, tmp_path))
-        
-        # Return immediately with upload ID
-        return {
-            "success": True,
-            "upload_id": upload_id,
-            "message": "Resume upload started"
-        }
+    # Stream the upload to disk in fixed-size chunks so memory stays O(chunk),
+    # counting bytes since Content-Length is absent for chunked uploads. The
+    # whole copy runs in one worker thread rather than hopping per chunk.
+    with tempfile.NamedTemporaryFile(delete=False, suffix=Path(file.filename).suffix) as tmp:
+        tmp_path = tmp.name
+        written, content_hash = await asyncio.to_thread(_copy_upload, file.file, tmp, MAX_UPLOAD_BYTES)
     
-    except Exception as e:
-        logger.error(f"Error starting resume upload: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if written > MAX_UPLOAD_BYTES:
+        await asyncio.to_thread(_safe_unlink, tmp_path)
+        raise HTTPException(status_code=413, detail="Resume file too large")
+    
+    # Generate unique upload ID
+    upload_id = secrets.token_urlsafe(16)
+    
+    # Start background processing
+    if background_tasks:
+        background_tasks.add_task(process_resume_background, upload_id, tmp_path, content_hash)
+    else:
+        # Fallback for testing without background tasks
+        asyncio.create_task(process_resume_background(upload_id, tmp_path, content_hash))
+    
+    # Return immediately with upload ID
+    return {
+        "success": True,
+        "upload_id": upload_id,
+        "message": "Resume upload started"
+    }
 
 
 @app.get("/api/resume/upload/{upload_id}")
 async def get_upload_result(upload_id: str):
-    """Get the result of a resume upload request."""
-    if upload_id not in upload_results:
-        return {
-            "success": False,
-            "status": "processing",
-            "message": "Resume is still being processed"
-        }
+    """Get the result of a resume upload request (202 with no body while pending)."""
+    result = await app.state.upload_results.get(upload_id)
+    if result is None:
+        # Still processing: an empty 202 keeps the common poll response cheap
+        return Response(status_code=202)
     
-    result = upload_results[upload_id]
     # Clean up old results after retrieval
     if result.get("success"):
-        del upload_results[upload_id]
+        await app.state.upload_results.delete(upload_id)
     
-    return result
+    # Stored results are already JSON-ready (model_dump(mode="json")), so skip
+    # FastAPI's jsonable_encoder pass over the whole profile
+    return ORJSONResponse(result)
 
 
 @app.post("/api/jobs/search")
-async def search_jobs(request: JobSearchRequest):
-    """Search for jobs in a category."""
-    try:
-        jobs = job_fetcher.search_jobs(
-            category=request.category,
-            location=request.location,
-            hours_ago=request.hours_ago
-        )
-        
-        return {
-            "success": True,
-            "jobs": jobs,
-            "count": len(jobs)
-        }
-    except Exception as e:
-        logger.error(f"Error searching jobs: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+async def search_jobs(request: JobSearchRequest, http_request: Request):
+    """Search for jobs in one or more categories.
+
+    Categories are searched concurrently in worker threads (the fetcher does
+    blocking HTTP), bounded by a semaphore to respect upstream rate limits.
+    The response carries an ETag; clients that send it back in If-None-Match
+    get a bodiless 304 when the results are unchanged.
+    """
+    categories = list(request.categories)
+    if request.category and request.category not in categories:
+        categories.insert(0, request.category)
+    if not categories:
+        raise HTTPException(status_code=400, detail="At least one category is required")
+
+    async def search_category(category: str) -> List[Dict[str, Any]]:
+        async with job_search_semaphore:
+            return await asyncio.to_thread(
+                app.state.job_fetcher.search_jobs,
+                category=category,
+                location=request.location,
+                hours_ago=request.hours_ago
+            )
+
+    results = await asyncio.gather(
+        *(search_category(c) for c in categories), return_exceptions=True
+    )
+    
+    jobs = []
+    for category, result in zip(categories, results):
+        if isinstance(result, BaseException):
+            if len(categories) == 1:
+                raise result
+            logger.warning("Job search failed for category %r: %s", category, result)
+            continue
+        jobs.extend(result)
+    if len(categories) > 1:
+        jobs = app.state.job_fetcher.deduplicate_jobs(jobs)
+    
+    return _etag_response(http_request, {
+        "success": True,
+        "jobs": jobs,
+        "count": len(jobs)
+    })
 
 
 @app.post("/api/jobs/apply")
-async def apply_to_job(request: Dict[str, Any], background_tasks: BackgroundTasks):
-    """Customize resume for a job application (non-blocking)."""
+async def apply_to_job(http_request: Request, background_tasks: BackgroundTasks):
+    """Customize resume for a job application (non-blocking).
+
+    The body (full profile plus job description) is parsed with orjson
+    rather than the stdlib json module.
+    """
     try:
-        # Generate unique job ID
-        job_id = str(uuid.uuid4())
-        
-        # Start background processing
-        background_tasks.add_task(process_job_background, job_id, request)
-        
-        # Return immediately with job ID
-        return {
-            "success": True,
-            "job_id": job_id,
-            "message": "Job processing started"
-        }
+        request = orjson.loads(await http_request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Request body must be valid JSON")
+    if not isinstance(request, dict):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON object")
     
-    except Exception as e:
-        logger.error(f"Error starting job processing: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Generate unique job ID
+    job_id = secrets.token_urlsafe(16)
+    
+    # Start background processing
+    background_tasks.add_task(process_job_background, job_id, request)
+    
+    # Return immediately with job ID
+    return {
+        "success": True,
+        "job_id": job_id,
+        "message": "Job processing started"
+    }
 
 
-@app.get("/api/jobs/apply/{job_id}")
+@app.get("/api/jobs/apply/{job_id}", deprecated=True)
 async def get_job_result(job_id: str):
-    """Get the result of a job processing request."""
-    if job_id not in job_results:
-        return {
-            "success": False,
-            "status": "processing",
-            "message": "Job is still processing"
-        }
+    """Get the result of a job processing request (202 with no body while pending).
+
+    Kept for older clients; new clients should use the /stream endpoint.
+    """
+    result = await app.state.job_results.get(job_id)
+    if result is None:
+        # Still processing: an empty 202 keeps the common poll response cheap
+        return Response(status_code=202)
     
-    result = job_results[job_id]
     # Clean up old results after retrieval
     if result.get("success"):
-        del job_results[job_id]
+        await app.state.job_results.delete(job_id)
     
-    return result
+    return ORJSONResponse(result)
+
+
+@app.get("/api/jobs/apply/{job_id}/stream")
+async def stream_job_result(job_id: str):
+    """Push the result of a job processing request as Server-Sent Events.
+
+    Sends a ``processing`` event every JOB_STREAM_HEARTBEAT_SECONDS while the
+    job runs, then a single ``done`` event whose data is the same JSON the
+    polling route returns. Gives up with a ``timeout`` event after
+    JOB_STREAM_MAX_SECONDS.
+    """
+    async def events():
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + JOB_STREAM_MAX_SECONDS
+        while True:
+            result = await app.state.job_results.wait(job_id, timeout=JOB_STREAM_HEARTBEAT_SECONDS)
+            if result is not None:
+                if result.get("success"):
+                    await app.state.job_results.delete(job_id)
+                yield b"event: done\ndata: " + orjson.dumps(result) + b"\n\n"
+                return
+            if loop.time() >= deadline:
+                yield b"event: timeout\ndata: {}\n\n"
+                return
+            yield b"event: processing\ndata: {}\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # A preset Content-Encoding makes GZipMiddleware pass the stream
+        # through; older Starlette releases otherwise buffer it to compress
+        headers={"Cache-Control": "no-cache", "Content-Encoding": "identity"},
+    )
 
 
 @app.post("/api/resume/export")
-async def export_resume(profile_data: Dict[str, Any]):
-    """Export resume to DOCX."""
-    try:
-        profile = Profile(**profile_data)
-        
-        # Create temp file for export
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".docx") as tmp:
-            output_path = tmp.name
-        
-        resume_exporter.export_to_docx(profile, output_path)
-        
-        # Read file and return
-        with open(output_path, "rb") as f:
-            content = f.read()
-        
-        os.unlink(output_path)
-        
-        return JSONResponse(
-            content={"success": True, "file": content.hex()},
-            headers={"Content-Type": "application/json"}
-        )
+async def export_resume(request: Request):
+    """Export resume to DOCX.
+
+    The body is validated straight from the raw JSON bytes, which lets
+    pydantic-core parse and validate in one pass instead of building an
+    intermediate dict first (and repeat exports reuse the cached Profile).
+    """
+    profile = _profile_from_json(await request.body())
     
-    except Exception as e:
-        logger.error(f"Error exporting resume: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    # Build the DOCX in memory (python-docx is synchronous, so off the loop)
+    content = await asyncio.to_thread(app.state.resume_exporter.export_to_bytes, profile)
+    
+    return Response(
+        content=content,
+        media_type=DOCX_MEDIA_TYPE,
+        headers={"Content-Disposition": 'attachment; filename="resume.docx"'},
+    )
 
 
 @app.post("/api/voice/process")
 async def process_voice_instruction(request: VoiceInstructionRequest):
     """Process voice or text instruction."""
-    try:
-        if request.text:
-            # Process text instruction
-            result = await voice_agent.execute(
-                input_data=request.text,
-                input_type="text_instruction"
-            )
-        elif request.audio_url:
-            # Process audio (would need to download first)
-            result = await voice_agent.execute(
-                input_data=request.audio_url,
-                input_type="voice_instruction"
+    if request.text:
+        # Process text instruction
+        result = await app.state.voice_agent.execute(
+            input_data=request.text,
+            input_type="text_instruction"
+        )
+    elif request.audio_url:
+        # Stream the audio to a temp file and hand the agent its path
+        try:
+            audio_path = await _download_to_tempfile(request.audio_url, app.state.http)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        try:
+            result = await app.state.voice_agent.execute(
+                input_data=audio_path,
+                input_type="voice_instruction",
+                audio_file_path=audio_path
             )
-        else:
-            raise HTTPException(status_code=400, detail="No instruction provided")
-        
-        if result["success"]:
-            return {
-                "success": True,
-                "transcription": result.get("transcription", ""),
-                "intent": result.get("intent", ""),
-                "constraints": result.get("constraints", [])
-            }
-        else:
-            raise HTTPException(status_code=400, detail=result.get("error", "Failed to process instruction"))
+        finally:
+            await asyncio.to_thread(_safe_unlink, audio_path)
+    else:
+        raise HTTPException(status_code=400, detail="No instruction provided")
     
-    except Exception as e:
-        logger.error(f"Error processing voice: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    if result["success"]:
+        return {
+            "success": True,
+            "transcription": result.get("transcription", ""),
+            "intent": result.get("intent", ""),
+            "constraints": result.get("constraints", [])
+        }
+    else:
+        raise HTTPException(status_code=400, detail=result.get("error", "Failed to process instruction"))
 
 
 @app.post("/api/linkedin/generate-message")
-async def generate_linkedin_message(request: Dict[str, Any]):
+async def generate_linkedin_message(request: LinkedInMessageRequest):
     """Generate personalized LinkedIn referral message."""
-    try:
-        job = request.get('job', {})
-        profile_data = request.get('profile', {})
-        tone = request.get('tone', 'professional')
-        custom_requirements = request.get('custom_requirements', '').strip()
-
-        if not job or not profile_data:
-            raise HTTPException(status_code=400, detail="Job and profile data required")
-
-        profile = Profile(**profile_data)
-
-        job_title = job.get('title', 'this position')
-        company = job.get('company', 'your company')
-        experience_title = profile.experiences[0].title if profile.experiences else 'software development'
-        top_skills = ', '.join([s.name for s in profile.skills[:5]]) if profile.skills else 'relevant technologies'
-
-        # Use LLM when custom requirements are provided
-        if custom_requirements:
-            experiences_summary = '; '.join(
-                [f"{e.title} at {e.company}" for e in profile.experiences[:3]]
-            ) if profile.experiences else 'no listed experience'
-
-            prompt = f"""Write a LinkedIn referral request message with the following details:
-
-Sender: {profile.name or 'the applicant'}
+    tone = request.tone
+    # Collapse whitespace so trivially different requirements share a cache entry
+    custom_requirements = " ".join(request.custom_requirements.split())
+
+    # Any non-empty job dict will do; missing title/company use the defaults
+    if not request.job or not (request.job.model_fields_set or request.job.model_extra) or not request.profile:
+        raise HTTPException(status_code=400, detail="Job and profile data required")
+
+    profile = _profile_from_json(orjson.dumps(request.profile))
+
+    job_title = request.job.title
+    company = request.job.company
+    # Shared by both branches; str.join builds a list internally anyway, so
+    # passing one directly is cheaper than a generator
+    top_skills = ', '.join([s.name for s in islice(profile.skills, 5)]) if profile.skills else 'relevant technologies'
+
+    # Use LLM when custom requirements are provided
+    if custom_requirements:
+        experiences_summary = '; '.join(
+            [f"{e.title} at {e.company}" for e in islice(profile.experiences, 3)]
+        ) if profile.experiences else 'no listed experience'
+
+        # Only the request details vary; the instructions live in the fixed
+        # system prompt so they form a stable, cacheable prefix
+        prompt = f"""Sender: {profile.name or 'the applicant'}
 Target role: {job_title} at {company}
 Sender's experience: {experiences_summary}
 Sender's top skills: {top_skills}
 Message tone: {tone}
 Custom requirements: {custom_requirements}
+Sign-off name: {profile.name or 'Your Name'}"""
 
-Rules:
-- Address the recipient as [Name] (placeholder)
-- Keep it genuine and human, not overly salesy
-- Apply the tone ({tone}) and every custom requirement strictly
-- End with the sender's name: {profile.name or 'Your Name'}
-- Return only the message text, no extra commentary"""
-
-            response = openai_client.chat.completions.create(
+        cache_key = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        message = _linkedin_message_cache.get(cache_key)
+        if message is None:
+            # Low temperature: cached messages are replayed, so keep them stable
+            response = await app.state.openai.client.chat.completions.create(
                 model=config.agent.model,
                 messages=[
-                    {"role": "system", "content": "You write concise, personalized LinkedIn referral request messages."},
+                    {"role": "system", "content": LINKEDIN_MESSAGE_SYSTEM_PROMPT},
                     {"role": "user", "content": prompt}
                 ],
-                temperature=0.7,
+                temperature=0.2,
                 max_tokens=400,
             )
+            if logger.isEnabledFor(logging.DEBUG):
+                details = getattr(response.usage, "prompt_tokens_details", None)
+                logger.debug(
+                    "LinkedIn message prompt tokens: %s (cached: %s)",
+                    response.usage.prompt_tokens,
+                    getattr(details, "cached_tokens", 0),
+                )
             message = response.choices[0].message.content.strip()
+            _linkedin_message_cache[cache_key] = message
 
-        else:
-            # Template fallback when no custom requirements
-            if tone == 'professional':
-                message = f"""Hi [Name],
-
-I hope this message finds you well. I noticed that {company} is hiring for the {job_title} position, and I am very interested in this opportunity.
-
-With my background in {experience_title} and expertise in {top_skills}, I believe I would be a strong fit for this role and could contribute meaningfully to the team.
-
-I would greatly appreciate it if you could refer me for this position or connect me with the hiring manager. I have attached my resume and would be happy to discuss how my skills and experience align with the team's needs.
-
-Thank you for considering my request. I look forward to the possibility of working together.
-
-Best regards,
-{profile.name or 'Your Name'}"""
-
-            elif tone == 'friendly':
-                message = f"""Hey [Name]!
-
-Hope you're doing well! I saw that {company} is looking for a {job_title}, and I'm really excited about this opportunity.
-
-I've been working in {experience_title} and have experience with {top_skills}. I think I'd be a great fit for the role and would love to be part of the team!
-
-Would you be able to refer me or point me in the right direction? I'd really appreciate any help you can offer. Happy to chat more about it if you'd like!
-
-Thanks so much!
-{profile.name or 'Your Name'}"""
-
-            else:  # concise
-                message = f"""Hi [Name],
-
-I'm interested in the {job_title} role at {company}. With my experience in {experience_title} and {top_skills}, I believe I'd be a strong candidate.
-
-Would you be able to refer me or connect me with the hiring team?
-
-Thanks,
-{profile.name or 'Your Name'}"""
-
-        return {
-            "success": True,
-            "message": message
-        }
+    else:
+        # Template fallback when no custom requirements
+        experience_title = profile.experiences[0].title if profile.experiences else 'software development'
+        message = _LINKEDIN_TEMPLATES[tone].substitute(
+            name=profile.name or 'Your Name',
+            company=company,
+            job_title=job_title,
+            experience_title=experience_title,
+            top_skills=top_skills,
+        )
 
-    except Exception as e:
-        logger.error(f"Error generating LinkedIn message: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "success": True,
+        "message": message
+    }
 
 
 @app.post("/api/linkedin/employees")
-def get_company_employees(request: EmployeeSearchRequest):
+async def get_company_employees(request: EmployeeSearchRequest):
     """Return up to 5 employees at a company for the LinkedIn referral modal.
 
-    Uses a sync def route (FastAPI runs it in a thread pool automatically).
+    The lookup is an in-memory table behind memoized name normalization, so
+    it runs directly on the event loop rather than via the thread pool.
     Returns an empty list (not an error) for unknown companies.
     """
     employees = fetch_linkedin_employees(request.company_name, request.company_linkedin_url)
     return {"success": True, "employees": employees}
 
 
-@app.post("/api/interview/prep-plan")
-async def generate_interview_prep(request: Dict[str, Any]):
-    """Generate interview preparation plan with hardcoded problems."""
-    try:
-        job = request.get('job', {})
-        
-        if not job:
-            raise HTTPException(status_code=400, detail="Job data required")
-        
-        # Return hardcoded prep plan (frontend has default, but backend can customize)
-        prep_plan = {
-            "leetcode_problems": [
-                {
-                    "title": "Two Sum",
-                    "difficulty": "Easy",
-                    "topic": "Arrays & Hashing",
-                    "url": "https://leetcode.com/problems/two-sum/",
-                    "priority": "High"
-                },
-                {
-                    "title": "Valid Parentheses",
-                    "difficulty": "Easy",
-                    "topic": "Stack",
-                    "url": "https://leetcode.com/problems/valid-parentheses/",
-                    "priority": "High"
-                },
-                {
-                    "title": "Merge Two Sorted Lists",
-                    "difficulty": "Easy",
-                    "topic": "Linked List",
-                    "url": "https://leetcode.com/problems/merge-two-sorted-lists/",
-                    "priority": "Medium"
-                },
-                {
-                    "title": "Binary Search",
-                    "difficulty": "Easy",
-                    "topic": "Binary Search",
-                    "url": "https://leetcode.com/problems/binary-search/",
-                    "priority": "High"
-                },
-                {
-                    "title": "Best Time to Buy and Sell Stock",
-                    "difficulty": "Easy",
-                    "topic": "Arrays",
-                    "url": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock/",
-                    "priority": "High"
-                },
-                {
-                    "title": "Longest Substring Without Repeating Characters",
-                    "difficulty": "Medium",
-                    "topic": "Sliding Window",
-                    "url": "https://leetcode.com/problems/longest-substring-without-repeating-characters/",
-                    "priority": "High"
-                },
-                {
-                    "title": "Product of Array Except Self",
-                    "difficulty": "Medium",
-                    "topic": "Arrays",
-                    "url": "https://leetcode.com/problems/product-of-array-except-self/",
-                    "priority": "High"
-                },
-                {
-                    "title": "LRU Cache",
-                    "difficulty": "Medium",
-                    "topic": "Design",
-                    "url": "https://leetcode.com/problems/lru-cache/",
-                    "priority": "High"
-                }
+# Hardcoded interview prep plan (frontend has default, but backend can customize).
+# It does not depend on the job, so the response body is serialized once.
+_PREP_PLAN = {
+    "leetcode_problems": [
+        {
+            "title": "Two Sum",
+            "difficulty": "Easy",
+            "topic": "Arrays & Hashing",
+            "url": "https://leetcode.com/problems/two-sum/",
+            "priority": "High"
+        },
+        {
+            "title": "Valid Parentheses",
+            "difficulty": "Easy",
+            "topic": "Stack",
+            "url": "https://leetcode.com/problems/valid-parentheses/",
+            "priority": "High"
+        },
+        {
+            "title": "Merge Two Sorted Lists",
+            "difficulty": "Easy",
+            "topic": "Linked List",
+            "url": "https://leetcode.com/problems/merge-two-sorted-lists/",
+            "priority": "Medium"
+        },
+        {
+            "title": "Binary Search",
+            "difficulty": "Easy",
+            "topic": "Binary Search",
+            "url": "https://leetcode.com/problems/binary-search/",
+            "priority": "High"
+        },
+        {
+            "title": "Best Time to Buy and Sell Stock",
+            "difficulty": "Easy",
+            "topic": "Arrays",
+            "url": "https://leetcode.com/problems/best-time-to-buy-and-sell-stock/",
+            "priority": "High"
+        },
+        {
+            "title": "Longest Substring Without Repeating Characters",
+            "difficulty": "Medium",
+            "topic": "Sliding Window",
+            "url": "https://leetcode.com/problems/longest-substring-without-repeating-characters/",
+            "priority": "High"
+        },
+        {
+            "title": "Product of Array Except Self",
+            "difficulty": "Medium",
+            "topic": "Arrays",
+            "url": "https://leetcode.com/problems/product-of-array-except-self/",
+            "priority": "High"
+        },
+        {
+            "title": "LRU Cache",
+            "difficulty": "Medium",
+            "topic": "Design",
+            "url": "https://leetcode.com/problems/lru-cache/",
+            "priority": "High"
+        }
+    ],
+    "system_design_topics": [
+        {
+            "title": "System Design Fundamentals",
+            "description": "Understanding scalability, load balancing, caching, and database sharding",
+            "resources": [
+                "System Design Primer (GitHub)",
+                "Designing Data-Intensive Applications (Book)",
+                "Grokking System Design Interview"
             ],
-            "system_design_topics": [
-                {
-                    "title": "System Design Fundamentals",
-                    "description": "Understanding scalability, load balancing, caching, and database sharding",
-                    "resources": [
-                        "System Design Primer (GitHub)",
-                        "Designing Data-Intensive Applications (Book)",
-                        "Grokking System Design Interview"
-                    ],
-                    "estimatedTime": "2-3 weeks"
-                },
-                {
-                    "title": "Design URL Shortener",
-                    "description": "Classic system design problem covering hashing, database design, and scaling",
-                    "resources": [
-                        "System Design Interview - URL Shortener",
-                        "YouTube: System Design URL Shortener"
-                    ],
-                    "estimatedTime": "3-4 hours"
-                },
-                {
-                    "title": "Design Social Media Feed",
-                    "description": "Learn about fan-out, caching strategies, and real-time updates",
-                    "resources": [
-                        "Designing Instagram/Twitter Feed",
-                        "System Design: News Feed"
-                    ],
-                    "estimatedTime": "4-5 hours"
-                },
-                {
-                    "title": "Design Rate Limiter",
-                    "description": "Understanding API rate limiting, token bucket, and distributed systems",
-                    "resources": [
-                        "Rate Limiting Algorithms",
-                        "System Design: API Rate Limiter"
-                    ],
-                    "estimatedTime": "2-3 hours"
-                }
+            "estimatedTime": "2-3 weeks"
+        },
+        {
+            "title": "Design URL Shortener",
+            "description": "Classic system design problem covering hashing, database design, and scaling",
+            "resources": [
+                "System Design Interview - URL Shortener",
+                "YouTube: System Design URL Shortener"
             ],
-            "behavioral_questions": [
-                "Tell me about a time you faced a challenging technical problem. How did you solve it?",
-                "Describe a situation where you had to work with a difficult team member.",
-                "Tell me about a project you're most proud of and why.",
-                "How do you handle tight deadlines and pressure?",
-                "Describe a time when you had to learn a new technology quickly.",
-                "Tell me about a time you made a mistake. How did you handle it?",
-                "How do you prioritize tasks when working on multiple projects?",
-                "Describe a situation where you had to give constructive feedback to a colleague.",
-                "Tell me about a time you disagreed with a technical decision. What did you do?",
-                "How do you stay updated with new technologies and industry trends?"
+            "estimatedTime": "3-4 hours"
+        },
+        {
+            "title": "Design Social Media Feed",
+            "description": "Learn about fan-out, caching strategies, and real-time updates",
+            "resources": [
+                "Designing Instagram/Twitter Feed",
+                "System Design: News Feed"
             ],
-            "timeline": "4-6 weeks of focused preparation"
-        }
-        
-        return {
-            "success": True,
-            "plan": prep_plan
+            "estimatedTime": "4-5 hours"
+        },
+        {
+            "title": "Design Rate Limiter",
+            "description": "Understanding API rate limiting, token bucket, and distributed systems",
+            "resources": [
+                "Rate Limiting Algorithms",
+                "System Design: API Rate Limiter"
+            ],
+            "estimatedTime": "2-3 hours"
         }
+    ],
+    "behavioral_questions": [
+        "Tell me about a time you faced a challenging technical problem. How did you solve it?",
+        "Describe a situation where you had to work with a difficult team member.",
+        "Tell me about a project you're most proud of and why.",
+        "How do you handle tight deadlines and pressure?",
+        "Describe a time when you had to learn a new technology quickly.",
+        "Tell me about a time you made a mistake. How did you handle it?",
+        "How do you prioritize tasks when working on multiple projects?",
+        "Describe a situation where you had to give constructive feedback to a colleague.",
+        "Tell me about a time you disagreed with a technical decision. What did you do?",
+        "How do you stay updated with new technologies and industry trends?"
+    ],
+    "timeline": "4-6 weeks of focused preparation"
+}
+_PREP_PLAN_RESPONSE = orjson.dumps({"success": True, "plan": _PREP_PLAN})
+
+
+@app.post("/api/interview/prep-plan")
+async def generate_interview_prep(request: InterviewPrepRequest):
+    """Generate interview preparation plan with hardcoded problems."""
+    if not request.job:
+        raise HTTPException(status_code=400, detail="Job data required")
     
-    except Exception as e:
-        logger.error(f"Error generating interview prep: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return Response(content=_PREP_PLAN_RESPONSE, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Worker count comes from WEB_CONCURRENCY. Without REDIS_URL it defaults
+    # to 1 because job/upload results live in process memory and a poll
+    # served by a different worker would never see the result; with Redis
+    # it defaults to one worker per core.
+    default_workers = (os.cpu_count() or 1) if config.redis_url else 1
+    limit_concurrency = os.getenv("LIMIT_CONCURRENCY")
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", str(default_workers))),
+        # uvloop/httptools come with uvicorn[standard]; fall back to asyncio/h11
+        loop="auto",
+        http="auto",
+        # Past this many open connections, answer 503 instead of queueing
+        limit_concurrency=int(limit_concurrency) if limit_concurrency else None,
+    )
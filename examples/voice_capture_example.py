@@ -1,11 +1,9 @@
-"""Example usage of Voice Capture Agent."""
+"""Example usage of Voice Capture Agent.
 
-import asyncio
-import sys
-import os
+Run from the project root with ``python -m examples.voice_capture_example``.
+"""
 
-# Add parent directory to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import asyncio
 
 from src.orchestrator.central_orchestrator import CentralOrchestrator
 from src.agents.voice_capture import VoiceCaptureAgent
@@ -14,7 +12,12 @@ from src.utils.logging import setup_logging
 logger = setup_logging()
 
 
-async def example_voice_capture():
+async def ainput(prompt=""):
+    """Read a line from stdin without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
+
+async def example_voice_capture(orchestrator):
     """Example: Capture and transcribe voice instructions."""
     
     print("="*60)
@@ -22,52 +25,71 @@ async def example_voice_capture():
     print("="*60)
     print()
     
-    # Initialize orchestrator
-    orchestrator = CentralOrchestrator()
-    
     # Create and register voice capture agent
     voice_agent = VoiceCaptureAgent(orchestrator)
     orchestrator.register_agent(voice_agent)
     
-    print(f"Registered agents: {orchestrator.list_agents()}")
-    print()
-    
-    # Option 1: Record from microphone
-    print("Option 1: Record from microphone")
-    print("This will record audio for 5 seconds...")
-    print("Press Enter to start recording (or Ctrl+C to skip)...")
+    # Connect to the API while waiting for the user to start recording;
+    # cancelled below if it is still running when the example ends
+    warmup = asyncio.create_task(voice_agent.warmup())
     
     try:
-        input()
-        print("Recording... (speak now)")
+        print(f"Registered agents: {orchestrator.list_agents()}")
+        print()
+    
+        # Option 1: Record from microphone
+        print("Option 1: Record from microphone")
+        print("This will record audio for 5 seconds...")
+        print("Press Enter to start recording (or Ctrl+C to skip)...")
+    
+        try:
+            await ainput()
+            print("Recording... (speak now)")
         
-        result = await voice_agent.capture_and_transcribe(record_duration=5)
+            result = await voice_agent.capture_and_transcribe(record_duration=5)
         
-        # capture_and_transcribe returns the output dict directly (from execute)
-        if result:
-            print("\n" + "="*60)
-            print("RESULTS:")
-            print("="*60)
-            print(f"Transcription: {result.get('transcription', 'N/A')}")
-            print(f"Intent: {result.get('intent', 'N/A')}")
-            print(f"Constraints: {result.get('constraints', [])}")
-            print("="*60)
-        else:
-            print("No result returned")
+            # capture_and_transcribe returns the output dict directly (from execute)
+            if result:
+                print("\n" + "="*60)
+                print("RESULTS:")
+                print("="*60)
+                print(f"Transcription: {result.get('transcription', 'N/A')}")
+                print(f"Intent: {result.get('intent', 'N/A')}")
+                print(f"Constraints: {result.get('constraints', [])}")
+                print("="*60)
+            else:
+                print("No result returned")
     
-    except KeyboardInterrupt:
-        print("\nSkipped microphone recording")
-    except Exception as e:
-        print(f"Error: {e}")
+        except KeyboardInterrupt:
+            print("\nSkipped microphone recording")
+        except Exception as e:
+            print(f"Error: {e}")
     
-    print()
-    print("="*60)
-    print("Example completed!")
-    print("="*60)
-    print()
-    print("To use with an audio file, modify the script to call:")
-    print("  result = await voice_agent.execute('path/to/audio.wav')")
+        print()
+        print("="*60)
+        print("Example completed!")
+        print("="*60)
+        print()
+        print("To use with an audio file, modify the script to call:")
+        print("  result = await voice_agent.execute('path/to/audio.wav')")
+    finally:
+        # Stop any warmup still running before the caller closes the client
+        warmup.cancel()
+        await asyncio.gather(warmup, return_exceptions=True)
+
+
+async def run():
+    """Run the example, closing the agents' API connections before the loop ends."""
+    orchestrator = CentralOrchestrator()
+    try:
+        await example_voice_capture(orchestrator)
+    finally:
+        await orchestrator.aclose()
+
+
+def main():
+    asyncio.run(run())
 
 
 if __name__ == "__main__":
-    asyncio.run(example_voice_capture())
+    main()
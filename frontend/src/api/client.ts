@@ -9,6 +9,36 @@ const client = axios.create({
   },
 })
 
+const JOB_TIMEOUT_RESULT = {
+  success: false,
+  error: 'Job processing timeout',
+}
+
+// Resolves with the job result pushed over Server-Sent Events, or null if the
+// stream could not be used (caller then falls back to polling)
+const streamJobResult = (jobId: string): Promise<any | null> => {
+  if (typeof EventSource === 'undefined') {
+    return Promise.resolve(null)
+  }
+
+  return new Promise((resolve) => {
+    const source = new EventSource(`${API_BASE_URL}/api/jobs/apply/${jobId}/stream`)
+
+    source.addEventListener('done', (event) => {
+      source.close()
+      resolve(JSON.parse((event as MessageEvent).data))
+    })
+    source.addEventListener('timeout', () => {
+      source.close()
+      resolve(JOB_TIMEOUT_RESULT)
+    })
+    source.onerror = () => {
+      source.close()
+      resolve(null)
+    }
+  })
+}
+
 export const api = {
   // Resume operations
   uploadResume: async (file: File) => {
@@ -34,10 +64,10 @@ export const api = {
       await new Promise((resolve) => setTimeout(resolve, 1000)) // Wait 1 second
 
       const resultResponse = await client.get(`/api/resume/upload/${uploadId}`)
-      const result = resultResponse.data
 
-      if (result.success !== false || result.status !== 'processing') {
-        return result
+      // 202 with an empty body means the result is not ready yet
+      if (resultResponse.status !== 202) {
+        return resultResponse.data
       }
 
       attempts++
@@ -50,8 +80,10 @@ export const api = {
   },
 
   exportResume: async (profile: any) => {
-    const response = await client.post('/api/resume/export', profile)
-    return response.data
+    const response = await client.post('/api/resume/export', profile, {
+      responseType: 'blob',
+    })
+    return response.data as Blob
   },
 
   // Job operations
@@ -80,6 +112,12 @@ export const api = {
 
     const jobId = startResponse.data.job_id
 
+    // Wait for the result to be pushed; fall back to polling if the stream fails
+    const streamed = await streamJobResult(jobId)
+    if (streamed !== null) {
+      return streamed
+    }
+
     // Poll for the result
     const maxAttempts = 300 // 5 minutes with 1 second intervals
     let attempts = 0
@@ -88,19 +126,16 @@ export const api = {
       await new Promise((resolve) => setTimeout(resolve, 1000)) // Wait 1 second
 
       const resultResponse = await client.get(`/api/jobs/apply/${jobId}`)
-      const result = resultResponse.data
 
-      if (result.success !== false || result.status !== 'processing') {
-        return result
+      // 202 with an empty body means the result is not ready yet
+      if (resultResponse.status !== 202) {
+        return resultResponse.data
       }
 
       attempts++
     }
 
-    return {
-      success: false,
-      error: 'Job processing timeout',
-    }
+    return JOB_TIMEOUT_RESULT
   },
 
   // Voice operations
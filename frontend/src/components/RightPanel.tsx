@@ -26,13 +26,8 @@ export default function RightPanel({
     if (!displayProfile) return
 
     try {
-      const result = await api.exportResume(displayProfile)
-      // Convert hex to blob and download
-      const hex = result.file
-      const bytes = new Uint8Array(hex.match(/.{1,2}/g)!.map((byte: string) => parseInt(byte, 16)))
-      const blob = new Blob([bytes], {
-        type: 'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
-      })
+      // Backend streams the DOCX bytes directly
+      const blob = await api.exportResume(displayProfile)
       const url = URL.createObjectURL(blob)
       const a = document.createElement('a')
       a.href = url
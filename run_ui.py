@@ -5,11 +5,36 @@ import sys
 import os
 import shutil
 
+STREAMLIT_ARGS = [
+    "run",
+    "ui/app.py",
+    "--server.port=8501",
+    "--server.address=localhost",
+]
+
 if __name__ == "__main__":
     # Change to project root directory
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
-    # Find python executable (try python3 first, then python)
+    try:
+        # Run streamlit in this interpreter instead of spawning a second one
+        from streamlit.web.cli import main as streamlit_main
+    except ImportError:
+        streamlit_main = None
+    
+    if streamlit_main is not None:
+        print(f"🚀 Starting UI with {sys.executable}...")
+        print("📝 The UI will open in your browser at http://localhost:8501")
+        print("   Press Ctrl+C to stop the server\n")
+        
+        sys.argv = ["streamlit", *STREAMLIT_ARGS]
+        try:
+            streamlit_main()
+        except KeyboardInterrupt:
+            print("\n\n👋 UI server stopped. Goodbye!")
+        sys.exit(0)
+    
+    # Streamlit is not importable here; try another Python on PATH
     python_exe = shutil.which("python3") or shutil.which("python")
     
     if not python_exe:
@@ -23,12 +48,7 @@ if __name__ == "__main__":
     
     # Run streamlit
     try:
-        subprocess.run([
-            python_exe, "-m", "streamlit", "run", 
-            "ui/app.py",
-            "--server.port=8501",
-            "--server.address=localhost"
-        ])
+        subprocess.run([python_exe, "-m", "streamlit", *STREAMLIT_ARGS])
     except KeyboardInterrupt:
         print("\n\n👋 UI server stopped. Goodbye!")
     except Exception as e:
@@ -7,11 +7,10 @@ setup(
     version="0.1.0",
     description="Multi-agent system for intelligent resume customization",
     author="Your Name",
-    packages=find_packages(),
+    packages=find_packages(include=["src*"]),
     install_requires=[
         "openai>=1.12.0",
         "python-dotenv>=1.0.0",
-        "openai-whisper>=20231117",
         "pyaudio>=0.2.14",
         "python-docx>=1.1.0",
         "PyPDF2>=3.0.1",
@@ -20,5 +19,11 @@ setup(
         "typing-extensions>=4.8.0",
         "tenacity>=8.2.3",
     ],
+    extras_require={
+        # Share job/upload results across API workers (set REDIS_URL)
+        "redis": ["redis>=5.0.1"],
+        # Faster resume PDF text extraction (pdfplumber is used without it)
+        "pdf": ["pymupdf>=1.24.0"],
+    },
     python_requires=">=3.10",
 )
@@ -1,11 +1,14 @@
 """Data models for job description analysis."""
 
-from typing import List, Optional, Dict, Any
-from pydantic import BaseModel, Field
+import heapq
+from typing import List, Optional, Dict, Any, Tuple
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 
 class SkillRequirement(BaseModel):
     """Skill requirement from JD."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     skill: str
     is_required: bool = True
     importance: float = Field(ge=0.0, le=1.0, description="Importance score 0-1")
@@ -15,6 +18,8 @@ class SkillRequirement(BaseModel):
 
 class Responsibility(BaseModel):
     """Job responsibility."""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     description: str
     keywords: List[str] = Field(default_factory=list)
     importance: float = Field(ge=0.0, le=1.0)
@@ -50,23 +55,32 @@ class JobDescription(BaseModel):
     # Raw data
     raw_text: Optional[str] = None
     
+    # (source keywords, sorted result) from the last get_all_keywords() call
+    _keywords_cache: Optional[Tuple[tuple, Tuple[str, ...]]] = PrivateAttr(default=None)
+    
     def get_all_keywords(self) -> List[str]:
         """Get all ATS-relevant keywords."""
-        keywords = set()
-        keywords.update(self.ats_keywords)
-        keywords.update(self.technical_keywords)
-        keywords.update([s.skill for s in self.required_skills])
-        keywords.update([s.skill for s in self.preferred_skills])
-        return sorted(list(keywords))
+        # The source lists can be reassigned or mutated in place, so the cache
+        # is keyed on their contents; comparing tuples is cheaper than the
+        # union and sort it saves
+        source = (
+            tuple(self.ats_keywords),
+            tuple(self.technical_keywords),
+            tuple(s.skill for s in self.required_skills),
+            tuple(s.skill for s in self.preferred_skills),
+        )
+        if self._keywords_cache is None or self._keywords_cache[0] != source:
+            keywords = set()
+            for group in source:
+                keywords.update(group)
+            self._keywords_cache = (source, tuple(sorted(keywords)))
+        return list(self._keywords_cache[1])
     
     def get_priority_skills(self, top_n: int = 10) -> List[str]:
         """Get top priority skills."""
-        all_skills = []
-        for skill_req in self.required_skills:
-            all_skills.append((skill_req.skill, skill_req.importance * 1.5))  # Required skills weighted higher
-        for skill_req in self.preferred_skills:
-            all_skills.append((skill_req.skill, skill_req.importance))
+        weighted = [(s.skill, s.importance * 1.5) for s in self.required_skills]  # Required skills weighted higher
+        weighted.extend((s.skill, s.importance) for s in self.preferred_skills)
         
-        # Sort by importance
-        all_skills.sort(key=lambda x: x[1], reverse=True)
-        return [skill for skill, _ in all_skills[:top_n]]
+        # Partial selection by importance; ties keep their original order
+        top = heapq.nlargest(top_n, weighted, key=lambda x: x[1])
+        return [skill for skill, _ in top]
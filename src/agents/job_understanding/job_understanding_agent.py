@@ -1,7 +1,9 @@
 """Job Understanding Agent - Analyzes job descriptions."""
 
+import asyncio
 import json
 import logging
+import re
 from typing import Dict, Any, Optional
 
 from src.orchestrator.base_agent import BaseAgent
@@ -10,6 +12,19 @@ from .jd_models import JobDescription, SkillRequirement, Responsibility
 
 logger = logging.getLogger(__name__)
 
+# Common ATS keyword patterns, compiled once into a single alternation each so
+# a JD is scanned in one pass. Text is lowercased before matching.
+_TECH_KEYWORD_PATTERN = re.compile(
+    r'\b('
+    r'python|java|javascript|typescript|react|node\.js|aws|azure|gcp|docker|kubernetes|sql|nosql|mongodb|postgresql|redis|git|ci/cd|agile|scrum'
+    r'|machine learning|ml|ai|deep learning|neural networks|nlp|computer vision|data science|analytics'
+    r'|distributed systems|microservices|api|rest|graphql|serverless|cloud|devops|infrastructure'
+    r')\b'
+)
+_SOFT_SKILL_PATTERN = re.compile(
+    r'\b(leadership|communication|collaboration|teamwork|problem solving|analytical|creative|strategic|detail-oriented)\b'
+)
+
 
 class JobUnderstandingAgent(BaseAgent):
     """Analyzes job descriptions and extracts key information."""
@@ -39,7 +54,7 @@ class JobUnderstandingAgent(BaseAgent):
             # Fetch from URL
             from src.utils.jd_fetcher import JDFetcher
             fetcher = JDFetcher()
-            result = fetcher.fetch(jd_url)
+            result = await asyncio.to_thread(fetcher.fetch, jd_url)
             if not result["success"]:
                 raise ValueError(f"Failed to fetch JD: {result.get('error')}")
             text = result["text"]
@@ -59,9 +74,8 @@ class JobUnderstandingAgent(BaseAgent):
         # Extract ATS keywords
         jd = self._extract_ats_keywords(jd, text)
         
-        logger.info(f"JD analyzed: {len(jd.required_skills)} required skills, "
-                   f"{len(jd.preferred_skills)} preferred skills, "
-                   f"{len(jd.ats_keywords)} ATS keywords")
+        logger.info("JD analyzed: %s required skills, %s preferred skills, %s ATS keywords",
+                    len(jd.required_skills), len(jd.preferred_skills), len(jd.ats_keywords))
         
         return jd
     
@@ -117,7 +131,7 @@ Identify what the role emphasizes (e.g., building scalable systems, research, pr
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -136,7 +150,7 @@ Identify what the role emphasizes (e.g., building scalable systems, research, pr
             return structured_data
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response: {e}")
+            logger.error("Failed to parse LLM response: %s", e)
             return {
                 "title": None,
                 "company": None,
@@ -147,7 +161,7 @@ Identify what the role emphasizes (e.g., building scalable systems, research, pr
                 "priorities": {}
             }
         except Exception as e:
-            logger.error(f"JD analysis failed: {e}")
+            logger.error("JD analysis failed: %s", e)
             raise
     
     def _build_job_description(
@@ -217,27 +231,13 @@ Identify what the role emphasizes (e.g., building scalable systems, research, pr
     
     def _extract_ats_keywords(self, jd: JobDescription, text: str) -> JobDescription:
         """Extract ATS-friendly keywords from JD text."""
-        import re
-        
-        # Common ATS keywords patterns
-        tech_patterns = [
-            r'\b(python|java|javascript|typescript|react|node\.js|aws|azure|gcp|docker|kubernetes|sql|nosql|mongodb|postgresql|redis|git|ci/cd|agile|scrum)\b',
-            r'\b(machine learning|ml|ai|deep learning|neural networks|nlp|computer vision|data science|analytics)\b',
-            r'\b(distributed systems|microservices|api|rest|graphql|serverless|cloud|devops|infrastructure)\b',
-        ]
-        
         ats_keywords = set()
         technical_keywords = set()
         
         text_lower = text.lower()
         
-        # Extract from patterns
-        for pattern in tech_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    match = match[0]
-                technical_keywords.add(match.lower())
+        # Extract from patterns (single pass over the lowered text)
+        technical_keywords.update(_TECH_KEYWORD_PATTERN.findall(text_lower))
         
         # Add skills as keywords
         for skill in jd.all_skills:
@@ -251,14 +251,7 @@ Identify what the role emphasizes (e.g., building scalable systems, research, pr
                 technical_keywords.add(keyword.lower())
         
         # Soft skills
-        soft_skill_patterns = [
-            r'\b(leadership|communication|collaboration|teamwork|problem solving|analytical|creative|strategic|detail-oriented)\b'
-        ]
-        
-        soft_skills = set()
-        for pattern in soft_skill_patterns:
-            matches = re.findall(pattern, text_lower, re.IGNORECASE)
-            soft_skills.update(matches)
+        soft_skills = set(_SOFT_SKILL_PATTERN.findall(text_lower))
         
         jd.ats_keywords = sorted(list(ats_keywords))
         jd.technical_keywords = sorted(list(technical_keywords))
@@ -1,11 +1,14 @@
 """Profile Structuring Agent - Parses resume and structures profile data."""
 
+import asyncio
 import json
 import logging
+from concurrent.futures import Executor
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 from src.orchestrator.base_agent import BaseAgent
+from src.utils.openai_client import LoopBoundOpenAI
 from src.config import config
 from .resume_parser import ResumeParser
 from .tech_normalizer import TechNormalizer
@@ -17,10 +20,24 @@ logger = logging.getLogger(__name__)
 class ProfileParserAgent(BaseAgent):
     """Parses resume files and structures profile data."""
     
-    def __init__(self, orchestrator=None):
-        super().__init__(orchestrator)
+    def __init__(
+        self,
+        orchestrator=None,
+        executor: Optional[Executor] = None,
+        openai: Optional[LoopBoundOpenAI] = None,
+    ):
+        """
+        Args:
+            orchestrator: Orchestrator to register with
+            executor: Where to run file parsing (PDF/DOCX text extraction is
+                CPU-bound, so servers pass a process pool). Defaults to the
+                event loop's thread pool.
+            openai: Shared OpenAI client pool (see ``BaseAgent``)
+        """
+        super().__init__(orchestrator, openai=openai)
         self.parser = ResumeParser()
         self.normalizer = TechNormalizer()
+        self.executor = executor
     
     async def process(
         self,
@@ -45,16 +62,18 @@ class ProfileParserAgent(BaseAgent):
             raise ValueError("Resume file path must be provided")
         
         # Parse resume file
-        logger.info(f"Parsing resume from: {file_path}")
-        parsed_data = self.parser.parse(file_path)
+        logger.info("Parsing resume from: %s", file_path)
+        parsed_data = await asyncio.get_running_loop().run_in_executor(
+            self.executor, self.parser.parse, file_path
+        )
         raw_text = parsed_data['text']
         
         # Log extracted text length
-        logger.info(f"Extracted {len(raw_text)} characters from resume file")
+        logger.info("Extracted %s characters from resume file", len(raw_text))
         
         # If text is very short, warn
         if len(raw_text) < 500:
-            logger.warning(f"Resume text seems very short ({len(raw_text)} chars). May indicate parsing issue.")
+            logger.warning("Resume text seems very short (%s chars). May indicate parsing issue.", len(raw_text))
         
         # Use LLM to extract structured data
         structured_data = await self._extract_structured_data(raw_text)
@@ -65,17 +84,15 @@ class ProfileParserAgent(BaseAgent):
         # Normalize technologies
         profile = self._normalize_profile(profile)
         
-        logger.info(f"Profile parsed: {len(profile.experiences)} experiences, "
-                   f"{len(profile.education)} education entries, "
-                   f"{len(profile.skills)} skills, "
-                   f"{len(profile.projects)} projects, "
-                   f"{len(profile.certifications)} certifications, "
-                   f"{len(profile.awards)} awards, "
-                   f"{len(profile.other_sections)} other sections")
+        logger.info("Profile parsed: %s experiences, %s education entries, %s skills, "
+                    "%s projects, %s certifications, %s awards, %s other sections",
+                    len(profile.experiences), len(profile.education), len(profile.skills),
+                    len(profile.projects), len(profile.certifications), len(profile.awards),
+                    len(profile.other_sections))
         
         # Log other sections details
         for section in profile.other_sections:
-            logger.info(f"  - {section.name}: {len(section.items)} items")
+            logger.info("  - %s: %s items", section.name, len(section.items))
         
         return profile
     
@@ -89,7 +106,7 @@ class ProfileParserAgent(BaseAgent):
         resume_text = text[:text_limit]
         
         # Log text length for debugging
-        logger.info(f"Extracting from resume text: {len(text)} chars total, using {len(resume_text)} chars")
+        logger.info("Extracting from resume text: %s chars total, using %s chars", len(text), len(resume_text))
         
         prompt = f"""Extract structured information from the following resume text. 
 
@@ -212,7 +229,7 @@ Be extremely thorough. Extract ALL information present in the resume. If a field
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -238,18 +255,17 @@ Be extremely thorough. Extract ALL information present in the resume. If a field
                     structured_data[field] = []
 
             # Log what was extracted for debugging
-            logger.info(f"Extracted sections: experiences={len(structured_data['experiences'])}, "
-                       f"education={len(structured_data['education'])}, "
-                       f"projects={len(structured_data['projects'])}, "
-                       f"certifications={len(structured_data['certifications'])}, "
-                       f"awards={len(structured_data['awards'])}, "
-                       f"other_sections={len(structured_data['other_sections'])}")
+            logger.info("Extracted sections: experiences=%s, education=%s, projects=%s, "
+                        "certifications=%s, awards=%s, other_sections=%s",
+                        len(structured_data['experiences']), len(structured_data['education']),
+                        len(structured_data['projects']), len(structured_data['certifications']),
+                        len(structured_data['awards']), len(structured_data['other_sections']))
 
             return structured_data
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {e}")
-            logger.error(f"Response: {content[:500]}")
+            logger.error("Failed to parse LLM response as JSON: %s", e)
+            logger.error("Response: %s", content[:500])
             # Return complete structure with all sections
             return {
                 "personal_info": {},
@@ -265,7 +281,7 @@ Be extremely thorough. Extract ALL information present in the resume. If a field
                 "other_sections": []
             }
         except Exception as e:
-            logger.error(f"Failed to extract structured data: {e}")
+            logger.error("Failed to extract structured data: %s", e)
             raise
     
     def _build_profile(
@@ -7,6 +7,14 @@ import docx
 import PyPDF2
 import pdfplumber
 
+# Make PyMuPDF optional (C-backed, much faster than pdfplumber when installed)
+try:
+    import pymupdf
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+    pymupdf = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +44,7 @@ class ResumeParser:
         if file_ext not in self.supported_formats:
             raise ValueError(f"Unsupported file format: {file_ext}. Supported: {self.supported_formats}")
         
-        logger.info(f"Parsing resume: {file_path} (format: {file_ext})")
+        logger.info("Parsing resume: %s (format: %s)", file_path, file_ext)
         
         if file_ext == '.pdf':
             return self._parse_pdf(file_path)
@@ -47,6 +55,12 @@ class ResumeParser:
     
     def _parse_pdf(self, file_path: str) -> Dict[str, Any]:
         """Parse PDF file."""
+        if PYMUPDF_AVAILABLE:
+            try:
+                return self._parse_pdf_pymupdf(file_path)
+            except Exception as e:
+                logger.warning("PyMuPDF failed, trying pdfplumber: %s", e)
+        
         text_parts = []
         metadata = {}
         
@@ -67,7 +81,7 @@ class ResumeParser:
                         'creator': pdf.metadata.get('Creator'),
                     }
         except Exception as e:
-            logger.warning(f"pdfplumber failed, trying PyPDF2: {e}")
+            logger.warning("pdfplumber failed, trying PyPDF2: %s", e)
             # Fallback to PyPDF2
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -92,6 +106,33 @@ class ResumeParser:
             'page_count': len(text_parts)
         }
     
+    def _parse_pdf_pymupdf(self, file_path: str) -> Dict[str, Any]:
+        """Parse PDF file with PyMuPDF."""
+        text_parts = []
+        
+        with pymupdf.open(file_path) as pdf:
+            for page in pdf:
+                # sort=True yields reading order, like pdfplumber's extract_text
+                page_text = page.get_text(sort=True).strip()
+                if page_text:
+                    text_parts.append(page_text)
+            
+            metadata = {}
+            if pdf.metadata:
+                metadata = {
+                    'title': pdf.metadata.get('title') or None,
+                    'author': pdf.metadata.get('author') or None,
+                    'subject': pdf.metadata.get('subject') or None,
+                    'creator': pdf.metadata.get('creator') or None,
+                }
+        
+        return {
+            'text': '\n\n'.join(text_parts),
+            'metadata': metadata,
+            'format': 'pdf',
+            'page_count': len(text_parts)
+        }
+    
     def _parse_docx(self, file_path: str) -> Dict[str, Any]:
         """Parse DOCX file."""
         try:
@@ -126,5 +167,5 @@ class ResumeParser:
             }
             
         except Exception as e:
-            logger.error(f"Failed to parse DOCX: {e}")
+            logger.error("Failed to parse DOCX: %s", e)
             raise
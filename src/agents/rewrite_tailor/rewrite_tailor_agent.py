@@ -1,5 +1,6 @@
 """Rewrite & Tailor Agent - Customizes resume based on JD and instructions."""
 
+import copy
 import json
 import logging
 from typing import Dict, Any, Optional, List
@@ -46,24 +47,24 @@ class RewriteTailorAgent(BaseAgent):
                 instructions['job_role'] = job_role
             elif instructions is None:
                 instructions = {'job_role': job_role}
-        logger.info(f"Creating edit plan... Profile has {len(profile.experiences)} experiences, {len(profile.projects)} projects")
+        logger.info("Creating edit plan... Profile has %s experiences, %s projects", len(profile.experiences), len(profile.projects))
         
         # First, identify ALL sections that need editing
         sections_to_edit = await self._identify_sections_to_edit(profile, jd, company_name, job_role)
-        logger.info(f"Identified {len(sections_to_edit)} sections that need editing: {sections_to_edit}")
+        logger.info("Identified %s sections that need editing: %s", len(sections_to_edit), sections_to_edit)
         
         # Create edit plan (but don't rely on it - we'll force comprehensive editing)
         edit_plan = await self._create_edit_plan(profile, jd, instructions, company_name, job_role)
-        logger.info(f"Edit plan created with {len(edit_plan.actions)} actions")
+        logger.info("Edit plan created with %s actions", len(edit_plan.actions))
         
         # FORCE comprehensive editing - don't rely on edit plan alone
         # Calculate minimum expected edits
         min_expected_edits = self._calculate_minimum_expected_edits(profile)
-        logger.info(f"Minimum expected edits: {min_expected_edits}")
+        logger.info("Minimum expected edits: %s", min_expected_edits)
         
         # If edit plan is too small, log warning but proceed with forced editing
         if len(edit_plan.actions) < min_expected_edits * 0.5:
-            logger.warning(f"Edit plan has only {len(edit_plan.actions)} actions, but expected at least {min_expected_edits}. Forcing comprehensive edits.")
+            logger.warning("Edit plan has only %s actions, but expected at least %s. Forcing comprehensive edits.", len(edit_plan.actions), min_expected_edits)
         
         # Skills gap analysis is optional - skip if method doesn't exist yet
         # (This will be implemented in future enhancement)
@@ -77,7 +78,7 @@ class RewriteTailorAgent(BaseAgent):
         evaluation = await self._evaluate_edit_completeness(
             profile, edited_profile, sections_to_edit, jd
         )
-        logger.info(f"Edit evaluation: {evaluation}")
+        logger.info("Edit evaluation: %s", evaluation)
         
         # Count actual changes made
         changes_count = len(edit_plan.actions)
@@ -90,7 +91,7 @@ class RewriteTailorAgent(BaseAgent):
                 if proj.bullets:
                     changes_count += len(proj.bullets)
         
-        logger.info(f"Applied {changes_count} total edits to resume across {len(sections_to_edit)} sections")
+        logger.info("Applied %s total edits to resume across %s sections", changes_count, len(sections_to_edit))
         
         return edited_profile
     
@@ -162,7 +163,7 @@ Return a comprehensive plan with many actions.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -209,7 +210,7 @@ Return a comprehensive plan with many actions.
             return edit_plan
             
         except Exception as e:
-            logger.error(f"Failed to create edit plan: {e}")
+            logger.error("Failed to create edit plan: %s", e)
             # Return minimal plan
             return EditPlan(
                 actions=[],
@@ -301,7 +302,7 @@ Return a comprehensive plan with many actions.
                 if section.items:
                     sections_to_edit.append(f"other_section_{section.name}")
         
-        logger.info(f"Identified {len(sections_to_edit)} sections/bullets to edit: {sections_to_edit[:10]}...")
+        logger.info("Identified %s sections/bullets to edit: %s...", len(sections_to_edit), sections_to_edit[:10])
         return sections_to_edit
     
     async def _apply_edits_comprehensive(
@@ -327,8 +328,9 @@ Return a comprehensive plan with many actions.
         job_role: Optional[str] = None
     ) -> Profile:
         """Apply comprehensive edits to profile across ALL sections while preserving structure."""
-        # Create deep copy to preserve original structure
-        edited_profile = profile.model_copy(deep=True)
+        # Copy only the sections edits can mutate; the original is kept intact
+        # for the before/after comparisons below
+        edited_profile = self._copy_for_editing(profile)
         
         # Preserve original section order and structure
         # Store original counts to ensure we don't lose sections
@@ -351,13 +353,13 @@ Return a comprehensive plan with many actions.
                 elif action.action_type == EditActionType.DEEMPHASIZE:
                     self._deemphasize_item(edited_profile, action)
             except Exception as e:
-                logger.warning(f"Failed to apply action {action.target}: {e}")
+                logger.warning("Failed to apply action %s: %s", action.target, e)
         
         # FORCE COMPREHENSIVE editing: Edit ALL sections systematically
         # This happens REGARDLESS of edit plan - we force edits on everything
         
         edit_count_before = self._count_edits_made(profile, edited_profile)
-        logger.info(f"Edits before comprehensive editing: {edit_count_before}")
+        logger.info("Edits before comprehensive editing: %s", edit_count_before)
         
         # 1. Summary section - ALWAYS edit if exists (Strategy 4: Relevant Summary)
         if edited_profile.summary:
@@ -383,7 +385,7 @@ Return a comprehensive plan with many actions.
             logger.info("FORCING extensive JD keyword incorporation across ALL experiences...")
             await self._incorporate_jd_keywords_extensive(edited_profile, jd, edit_plan.keywords_to_add, instructions)
         elif company_name or job_role:
-            logger.info(f"FORCING edits based on company/role across ALL experiences...")
+            logger.info("FORCING edits based on company/role across ALL experiences...")
             await self._incorporate_company_role_edits(edited_profile, company_name, job_role, instructions)
         else:
             # Even with no JD/role, still try to improve bullets
@@ -392,10 +394,10 @@ Return a comprehensive plan with many actions.
         
         # 3. Update ALL project descriptions and bullets - FORCE THIS
         if edited_profile.projects:
-            logger.info(f"FORCING edits to {len(edited_profile.projects)} projects...")
+            logger.info("FORCING edits to %s projects...", len(edited_profile.projects))
             for proj_idx, proj in enumerate(edited_profile.projects):
                 if proj.description:
-                    logger.info(f"Rewriting project {proj_idx} description: {proj.name}")
+                    logger.info("Rewriting project %s description: %s", proj_idx, proj.name)
                     if jd:
                         new_desc = await self._rewrite_project_description(proj.description, jd)
                         if new_desc:
@@ -403,7 +405,7 @@ Return a comprehensive plan with many actions.
                 
                 # FORCE rewrite of ALL project bullets
                 if proj.bullets:
-                    logger.info(f"FORCING rewrite of {len(proj.bullets)} bullets for project {proj.name}")
+                    logger.info("FORCING rewrite of %s bullets for project %s", len(proj.bullets), proj.name)
                     for i, bullet in enumerate(proj.bullets):
                         original_bullet = bullet
                         new_bullet = None
@@ -441,9 +443,9 @@ Return a comprehensive plan with many actions.
                         # Only apply if evaluation passed or no JD
                         if new_bullet and (evaluation_passed or not jd):
                             proj.bullets[i] = new_bullet
-                            logger.debug(f"✓ Applied project bullet {i} for {proj.name}")
+                            logger.debug("✓ Applied project bullet %s for %s", i, proj.name)
                         elif new_bullet and not evaluation_passed:
-                            logger.warning(f"✗ Rejected project bullet {i} for {proj.name} - failed relevance evaluation")
+                            logger.warning("✗ Rejected project bullet %s for %s - failed relevance evaluation", i, proj.name)
         
         # 4. Update skills section - FORCE THIS
         if edited_profile.skills:
@@ -454,31 +456,48 @@ Return a comprehensive plan with many actions.
         
         # 5. Update other sections if needed
         if edited_profile.other_sections:
-            logger.info(f"Updating {len(edited_profile.other_sections)} other sections...")
+            logger.info("Updating %s other sections...", len(edited_profile.other_sections))
             for section in edited_profile.other_sections:
                 if section.items and jd:
                     await self._update_other_section(edited_profile, section, jd)
         
         edit_count_after = self._count_edits_made(profile, edited_profile)
-        logger.info(f"Edits after comprehensive editing: {edit_count_after} (added {edit_count_after - edit_count_before} edits)")
+        logger.info("Edits after comprehensive editing: %s (added %s edits)", edit_count_after, edit_count_after - edit_count_before)
         
         # Ensure structure is preserved - verify section counts
         # Don't remove sections, only modify content
         if len(edited_profile.experiences) < original_exp_count:
-            logger.warning(f"Experience count decreased from {original_exp_count} to {len(edited_profile.experiences)}")
+            logger.warning("Experience count decreased from %s to %s", original_exp_count, len(edited_profile.experiences))
         if len(edited_profile.projects) < original_proj_count:
-            logger.warning(f"Project count decreased from {original_proj_count} to {len(edited_profile.projects)}")
+            logger.warning("Project count decreased from %s to %s", original_proj_count, len(edited_profile.projects))
         if len(edited_profile.education) < original_edu_count:
-            logger.warning(f"Education count decreased from {original_edu_count} to {len(edited_profile.education)}")
+            logger.warning("Education count decreased from %s to %s", original_edu_count, len(edited_profile.education))
         if len(edited_profile.certifications) < original_cert_count:
-            logger.warning(f"Certification count decreased from {original_cert_count} to {len(edited_profile.certifications)}")
+            logger.warning("Certification count decreased from %s to %s", original_cert_count, len(edited_profile.certifications))
         if len(edited_profile.awards) < original_award_count:
-            logger.warning(f"Award count decreased from {original_award_count} to {len(edited_profile.awards)}")
+            logger.warning("Award count decreased from %s to %s", original_award_count, len(edited_profile.awards))
         if len(edited_profile.other_sections) < original_other_sections_count:
-            logger.warning(f"Other sections count decreased from {original_other_sections_count} to {len(edited_profile.other_sections)}")
+            logger.warning("Other sections count decreased from %s to %s", original_other_sections_count, len(edited_profile.other_sections))
         
         return edited_profile
     
+    @staticmethod
+    def _copy_for_editing(profile: Profile) -> Profile:
+        """Return a copy of profile that can be edited without touching the original.
+
+        Experiences, projects and other sections have their bullets, technologies
+        and items edited in place, so they are deep-copied. Skills are only
+        appended to, so a new list suffices. Everything else (contact info,
+        education, certifications, raw text, ...) is never edited and is shared
+        with the original instead of being deep-copied.
+        """
+        return profile.model_copy(update={
+            "experiences": copy.deepcopy(profile.experiences),
+            "projects": copy.deepcopy(profile.projects),
+            "other_sections": copy.deepcopy(profile.other_sections),
+            "skills": list(profile.skills),
+        })
+    
     async def _incorporate_company_role_edits(
         self,
         profile: Profile,
@@ -526,7 +545,7 @@ Return only the rewritten bullet point.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer. Tailor bullets to job roles."},
@@ -538,7 +557,7 @@ Return only the rewritten bullet point.
             
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.warning(f"Failed to rewrite bullet for role: {e}")
+            logger.warning("Failed to rewrite bullet for role: %s", e)
             return None
     
     async def _rewrite_summary_for_role(self, summary: str, company_name: Optional[str], job_role: Optional[str]) -> str:
@@ -556,7 +575,7 @@ Return only the rewritten summary (2-3 sentences).
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer."},
@@ -568,7 +587,7 @@ Return only the rewritten summary (2-3 sentences).
             
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.warning(f"Failed to rewrite summary: {e}")
+            logger.warning("Failed to rewrite summary: %s", e)
             return summary
     
     async def _rewrite_summary(self, summary: str, jd: JobDescription, job_role: Optional[str] = None) -> str:
@@ -593,7 +612,7 @@ Return only the rewritten summary.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer. Rewrite summaries to match job descriptions."},
@@ -605,7 +624,7 @@ Return only the rewritten summary.
             
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.warning(f"Failed to rewrite summary: {e}")
+            logger.warning("Failed to rewrite summary: %s", e)
             return summary
     
     async def _rewrite_project_description(self, description: str, jd: JobDescription) -> str:
@@ -622,7 +641,7 @@ Return only the rewritten description.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer."},
@@ -634,7 +653,7 @@ Return only the rewritten description.
             
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.warning(f"Failed to rewrite project: {e}")
+            logger.warning("Failed to rewrite project: %s", e)
             return description
     
     def _rewrite_bullet(self, profile: Profile, action: EditAction):
@@ -679,13 +698,13 @@ Return only the rewritten description.
         all_keywords = jd.get_all_keywords() + keywords_to_add
         priority_keywords = jd.get_priority_skills(top_n=20)
         
-        logger.info(f"Starting extensive keyword incorporation: {len(profile.experiences)} experiences, {len(profile.projects)} projects")
+        logger.info("Starting extensive keyword incorporation: %s experiences, %s projects", len(profile.experiences), len(profile.projects))
         
         # EXTENSIVE: Rewrite ALL experience bullets (not just matching ones) - FORCE THIS
         bullets_rewritten = 0
         for exp_idx, exp in enumerate(profile.experiences):
             if exp.bullets:
-                logger.info(f"FORCING rewrite of {len(exp.bullets)} bullets for experience {exp_idx}: {exp.title} at {exp.company}")
+                logger.info("FORCING rewrite of %s bullets for experience %s: %s at %s", len(exp.bullets), exp_idx, exp.title, exp.company)
                 # Rewrite EVERY bullet to include JD keywords - NO EXCEPTIONS
                 for i, bullet in enumerate(exp.bullets):
                     # Find relevant keywords
@@ -728,7 +747,7 @@ Return only the rewritten description.
                             )
                             
                             if not evaluation_passed:
-                                logger.debug(f"Bullet rewrite attempt {attempt} failed evaluation for {exp.title} bullet {i}")
+                                logger.debug("Bullet rewrite attempt %s failed evaluation for %s bullet %s", attempt, exp.title, i)
                                 # Try with fewer keywords or different approach
                                 if attempt < max_attempts:
                                     # Reduce keywords for next attempt
@@ -741,7 +760,7 @@ Return only the rewritten description.
                     
                     # Fallback if enhanced rewrite didn't work
                     if not new_bullet or not new_bullet.strip() or new_bullet.strip().lower() == original_bullet.strip().lower():
-                        logger.debug(f"Enhanced rewrite didn't change bullet {i}, trying standard rewrite...")
+                        logger.debug("Enhanced rewrite didn't change bullet %s, trying standard rewrite...", i)
                         if relevant_keywords:
                             new_bullet = await self._rewrite_bullet_async(bullet, relevant_keywords)
                             if new_bullet and jd:
@@ -754,7 +773,7 @@ Return only the rewritten description.
                     
                     # Final fallback - only if evaluation passed or no JD
                     if not evaluation_passed and jd:
-                        logger.debug(f"Standard rewrite failed evaluation, trying general improvement...")
+                        logger.debug("Standard rewrite failed evaluation, trying general improvement...")
                         new_bullet = await self._improve_bullet_generally(original_bullet)
                         # Don't evaluate general improvement - it's a fallback
                         evaluation_passed = True
@@ -764,13 +783,13 @@ Return only the rewritten description.
                         if evaluation_passed or not jd:
                             exp.bullets[i] = new_bullet
                             bullets_rewritten += 1
-                            logger.debug(f"✓ Rewrote bullet {i} for {exp.title} (evaluation: {'passed' if evaluation_passed else 'no JD'})")
+                            logger.debug("✓ Rewrote bullet %s for %s (evaluation: %s)", i, exp.title, 'passed' if evaluation_passed else 'no JD')
                         else:
-                            logger.warning(f"✗ Rejected bullet {i} for {exp.title} - failed relevance evaluation")
+                            logger.warning("✗ Rejected bullet %s for %s - failed relevance evaluation", i, exp.title)
                     else:
-                        logger.warning(f"Could not rewrite bullet {i} for {exp.title} - all attempts failed")
+                        logger.warning("Could not rewrite bullet %s for %s - all attempts failed", i, exp.title)
         
-        logger.info(f"Rewrote {bullets_rewritten} experience bullets total")
+        logger.info("Rewrote %s experience bullets total", bullets_rewritten)
         
         # Continue with rest of experience editing
         for exp_idx, exp in enumerate(profile.experiences):
@@ -780,7 +799,7 @@ Return only the rewritten description.
                 new_bullet_text = await self._create_new_bullet_with_keywords_async(exp, priority_keywords[:5])
                 if new_bullet_text:
                     exp.bullets.append(new_bullet_text)
-                    logger.info(f"Added new bullet to {exp.title}")
+                    logger.info("Added new bullet to %s", exp.title)
             
             # Add ALL missing technologies from JD (not just 3)
             jd_techs = set([t.lower() for t in jd.technical_keywords])
@@ -788,13 +807,13 @@ Return only the rewritten description.
             missing_techs = [t for t in jd.technical_keywords if t.lower() not in current_techs]
             if missing_techs:
                 exp.technologies.extend(missing_techs[:5])
-                logger.info(f"Added {len(missing_techs[:5])} technologies to {exp.title}")
+                logger.info("Added %s technologies to %s", len(missing_techs[:5]), exp.title)
         
         # Update ALL project descriptions - FORCE THIS
         proj_bullets_rewritten = 0
         for proj_idx, proj in enumerate(profile.projects):
             if proj.bullets:
-                logger.info(f"FORCING rewrite of {len(proj.bullets)} bullets for project {proj_idx}: {proj.name}")
+                logger.info("FORCING rewrite of %s bullets for project %s: %s", len(proj.bullets), proj_idx, proj.name)
                 # Rewrite ALL project bullets - NO EXCEPTIONS
                 for i, bullet in enumerate(proj.bullets):
                     original_bullet = bullet
@@ -815,7 +834,7 @@ Return only the rewritten description.
                         )
                         
                         if not evaluation_passed:
-                            logger.debug(f"Project bullet rewrite failed evaluation, trying again...")
+                            logger.debug("Project bullet rewrite failed evaluation, trying again...")
                             # Try with fewer keywords
                             reduced_keywords = relevant_keywords[:max(2, len(relevant_keywords) - 1)]
                             if reduced_keywords:
@@ -838,11 +857,11 @@ Return only the rewritten description.
                         if evaluation_passed or not jd:
                             proj.bullets[i] = new_bullet
                             proj_bullets_rewritten += 1
-                            logger.debug(f"✓ Rewrote project bullet {i} for {proj.name} (evaluation: {'passed' if evaluation_passed else 'no JD'})")
+                            logger.debug("✓ Rewrote project bullet %s for %s (evaluation: %s)", i, proj.name, 'passed' if evaluation_passed else 'no JD')
                         else:
-                            logger.warning(f"✗ Rejected project bullet {i} for {proj.name} - failed relevance evaluation")
+                            logger.warning("✗ Rejected project bullet %s for %s - failed relevance evaluation", i, proj.name)
         
-        logger.info(f"Rewrote {proj_bullets_rewritten} project bullets total")
+        logger.info("Rewrote %s project bullets total", proj_bullets_rewritten)
         
         # Add missing technologies to projects
         for proj in profile.projects:
@@ -864,7 +883,7 @@ Return only the rewritten description.
             for skill_name in missing_skills[:10]:
                 profile.skills.append(Skill(name=skill_name))
                 added += 1
-            logger.info(f"Added {added} missing skills")
+            logger.info("Added %s missing skills", added)
         
         logger.info("Completed extensive keyword incorporation")
     
@@ -880,7 +899,7 @@ Return only the rewritten description.
             for skill_name in missing_skills[:10]:
                 profile.skills.append(Skill(name=skill_name))
                 added += 1
-            logger.info(f"Added {added} missing skills to skills section")
+            logger.info("Added %s missing skills to skills section", added)
     
     async def _update_other_section(self, profile: Profile, section, jd: JobDescription):
         """Update other sections (leadership, etc.) with JD keywords."""
@@ -894,7 +913,7 @@ Return only the rewritten description.
                     new_desc = await self._rewrite_bullet_async(desc, priority_keywords)
                     if new_desc:
                         item['description'] = new_desc
-                        logger.debug(f"Updated {section.name} item description")
+                        logger.debug("Updated %s item description", section.name)
     
     async def _evaluate_edit_completeness(
         self,
@@ -976,11 +995,10 @@ Return only the rewritten description.
             if evaluation["sections_identified"] > 0 else 0.0
         )
         
-        logger.info(f"Edit completeness: {evaluation['sections_edited']}/{evaluation['sections_identified']} sections edited "
-                   f"(score: {evaluation['completeness_score']:.2f})")
+        logger.info("Edit completeness: %s/%s sections edited (score: %.2f)", evaluation['sections_edited'], evaluation['sections_identified'], evaluation['completeness_score'])
         
         if evaluation["missing_edits"]:
-            logger.warning(f"Sections not edited: {evaluation['missing_edits']}")
+            logger.warning("Sections not edited: %s", evaluation['missing_edits'])
         
         return evaluation
     
@@ -1040,7 +1058,7 @@ Return only the improved bullet point.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer. Improve bullet points to be more impactful."},
@@ -1056,7 +1074,7 @@ Return only the improved bullet point.
                 return improved
             return None
         except Exception as e:
-            logger.warning(f"Failed to improve bullet: {e}")
+            logger.warning("Failed to improve bullet: %s", e)
             return None
     
     def _create_new_bullet_with_keywords(self, exp: Experience, keywords: List[str]) -> Optional[str]:
@@ -1085,7 +1103,7 @@ Return only the new bullet point.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer. Create impactful bullet points."},
@@ -1097,7 +1115,7 @@ Return only the new bullet point.
             
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.warning(f"Failed to create new bullet: {e}")
+            logger.warning("Failed to create new bullet: %s", e)
             return None
     
     async def _rewrite_summary(self, summary: str, jd: JobDescription, job_role: Optional[str] = None) -> str:
@@ -1130,7 +1148,7 @@ Return only the rewritten summary.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer. Rewrite summaries to perfectly match job descriptions."},
@@ -1142,7 +1160,7 @@ Return only the rewritten summary.
             
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.warning(f"Failed to rewrite summary: {e}")
+            logger.warning("Failed to rewrite summary: %s", e)
             return summary
     
     def _find_relevant_keywords(self, text: str, keywords: List[str]) -> List[str]:
@@ -1199,7 +1217,7 @@ Return only the rewritten bullet point.
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume writer. Aggressively incorporate keywords while keeping it natural."},
@@ -1211,7 +1229,7 @@ Return only the rewritten bullet point.
             
             return response.choices[0].message.content.strip()
         except Exception as e:
-            logger.warning(f"Failed to rewrite bullet: {e}")
+            logger.warning("Failed to rewrite bullet: %s", e)
             return None
     
     async def _evaluate_bullet_relevance(
@@ -1273,7 +1291,7 @@ Format: APPROVE/REJECT: [reason]
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert resume evaluator. Only approve changes that are relevant to the job description. Reject unnecessary or irrelevant changes."},
@@ -1287,14 +1305,14 @@ Format: APPROVE/REJECT: [reason]
             
             # Parse the response
             if evaluation_text.startswith("APPROVE"):
-                logger.debug(f"✓ Bullet evaluation PASSED: {evaluation_text[:100]}")
+                logger.debug("✓ Bullet evaluation PASSED: %s", evaluation_text[:100])
                 return True
             else:
-                logger.debug(f"✗ Bullet evaluation FAILED: {evaluation_text[:100]}")
+                logger.debug("✗ Bullet evaluation FAILED: %s", evaluation_text[:100])
                 return False
                 
         except Exception as e:
-            logger.warning(f"Failed to evaluate bullet relevance: {e}")
+            logger.warning("Failed to evaluate bullet relevance: %s", e)
             # On error, be conservative - only approve if keywords are present
             rewritten_lower = rewritten_bullet.lower()
             has_keywords = any(kw.lower() in rewritten_lower for kw in keywords[:3])
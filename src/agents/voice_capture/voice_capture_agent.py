@@ -3,6 +3,7 @@
 import asyncio
 import io
 import logging
+from pathlib import Path
 from typing import Dict, Any, Optional
 import wave
 
@@ -14,9 +15,9 @@ except ImportError:
     PYAUDIO_AVAILABLE = False
     pyaudio = None
 
-from openai import OpenAI
 
 from src.orchestrator.base_agent import BaseAgent
+from src.utils.openai_client import LoopBoundOpenAI
 from src.config import config
 
 logger = logging.getLogger(__name__)
@@ -25,9 +26,8 @@ logger = logging.getLogger(__name__)
 class VoiceCaptureAgent(BaseAgent):
     """Captures voice input and transcribes it using streaming STT."""
     
-    def __init__(self, orchestrator=None):
-        super().__init__(orchestrator)
-        self.client = OpenAI(api_key=config.openai_api_key)
+    def __init__(self, orchestrator=None, openai: Optional[LoopBoundOpenAI] = None):
+        super().__init__(orchestrator, openai=openai)
         self.stt_model = config.agent.stt_model
         # Audio format settings (only used if pyaudio is available)
         if PYAUDIO_AVAILABLE:
@@ -88,8 +88,13 @@ class VoiceCaptureAgent(BaseAgent):
                 "Install with: pip install pyaudio (requires portaudio system library)"
             )
         
-        logger.info(f"Recording audio for {duration} seconds...")
+        logger.info("Recording audio for %s seconds...", duration)
         
+        # stream.read() blocks for the whole recording, so keep it off the loop
+        return await asyncio.to_thread(self._record_audio_sync, duration)
+    
+    def _record_audio_sync(self, duration: int) -> str:
+        """Record audio from microphone into a temporary WAV file (blocking)."""
         audio = pyaudio.PyAudio()
         
         try:
@@ -125,33 +130,34 @@ class VoiceCaptureAgent(BaseAgent):
             wf.writeframes(b''.join(frames))
             wf.close()
             
-            logger.info(f"Audio recorded to {temp_path}")
+            logger.info("Audio recorded to %s", temp_path)
             return temp_path
             
         except Exception as e:
             audio.terminate()
-            logger.error(f"Audio recording failed: {e}")
+            logger.error("Audio recording failed: %s", e)
             raise
     
     async def _transcribe_audio(self, audio_path: str) -> str:
         """Transcribe audio using OpenAI Whisper API."""
-        logger.info(f"Transcribing audio from {audio_path}")
+        logger.info("Transcribing audio from %s", audio_path)
         
         try:
-            with open(audio_path, 'rb') as audio_file:
-                transcript = self.client.audio.transcriptions.create(
-                    model=self.stt_model,
-                    file=audio_file,
-                    response_format="text"
-                )
+            # Passing a Path lets the async client read the file without
+            # blocking the event loop
+            transcript = await self.async_client.audio.transcriptions.create(
+                model=self.stt_model,
+                file=Path(audio_path),
+                response_format="text"
+            )
             
             transcription = str(transcript).strip()
-            logger.info(f"Transcription: {transcription[:100]}...")
+            logger.info("Transcription: %s...", transcription[:100])
             
             return transcription
             
         except Exception as e:
-            logger.error(f"Transcription failed: {e}")
+            logger.error("Transcription failed: %s", e)
             raise
     
     async def _parse_instructions(self, transcription: str) -> Dict[str, Any]:
@@ -178,7 +184,7 @@ Respond in JSON format:
 """
         
         try:
-            response = self.client.chat.completions.create(
+            response = await self.async_client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert at parsing voice instructions for resume customization. Always respond with valid JSON."},
@@ -197,7 +203,7 @@ Respond in JSON format:
             }
             
         except Exception as e:
-            logger.error(f"Instruction parsing failed: {e}")
+            logger.error("Instruction parsing failed: %s", e)
             # Fallback: return transcription as intent
             return {
                 "intent": transcription,
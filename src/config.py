@@ -35,6 +35,7 @@ class Config(BaseModel):
     """Main configuration class."""
     openai_api_key: str = Field(..., description="OpenAI API key")
     rapidapi_key: Optional[str] = Field(default=None, description="RapidAPI key for job search")
+    redis_url: Optional[str] = Field(default=None, description="Redis URL for sharing job/upload results across workers")
     agent: AgentConfig = Field(default_factory=AgentConfig)
     guardrails: GuardrailConfig = Field(default_factory=GuardrailConfig)
     evaluation: EvaluationConfig = Field(default_factory=EvaluationConfig)
@@ -49,6 +50,7 @@ class Config(BaseModel):
         return cls(
             openai_api_key=api_key,
             rapidapi_key=os.getenv("RAPIDAPI_KEY"),
+            redis_url=os.getenv("REDIS_URL") or None,
             agent=AgentConfig(
                 model=os.getenv("AGENT_MODEL", "gpt-4o"),
                 stt_model=os.getenv("STT_MODEL", "whisper-1"),
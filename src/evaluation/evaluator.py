@@ -2,9 +2,9 @@
 
 from typing import Dict, Any, Optional
 import logging
-from openai import OpenAI
 
 from src.config import config
+from src.utils.openai_client import LoopBoundOpenAI
 from .metrics import EvaluationMetrics
 
 logger = logging.getLogger(__name__)
@@ -13,10 +13,10 @@ logger = logging.getLogger(__name__)
 class Evaluator:
     """Evaluates agent outputs using LLM-based evaluation."""
     
-    def __init__(self):
+    def __init__(self, openai: Optional[LoopBoundOpenAI] = None):
         self.enabled = config.evaluation.enabled
         self.model = config.evaluation.model
-        self.client = OpenAI(api_key=config.openai_api_key) if self.enabled else None
+        self.openai = openai or LoopBoundOpenAI()
     
     async def evaluate(
         self,
@@ -35,7 +35,7 @@ class Evaluator:
         Returns:
             EvaluationMetrics with scores and feedback
         """
-        if not self.enabled or not self.client:
+        if not self.enabled:
             return EvaluationMetrics(
                 overall_score=1.0,
                 criteria_scores={},
@@ -49,7 +49,7 @@ class Evaluator:
                 output, task_description, expected_criteria
             )
             
-            response = self.client.chat.completions.create(
+            response = await self.openai.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": "You are an expert evaluator for AI agent outputs."},
@@ -66,7 +66,7 @@ class Evaluator:
             return metrics
             
         except Exception as e:
-            logger.error(f"Evaluation failed: {e}")
+            logger.error("Evaluation failed: %s", e)
             return EvaluationMetrics(
                 overall_score=0.5,
                 criteria_scores={},
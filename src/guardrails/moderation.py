@@ -2,9 +2,9 @@
 
 from typing import List, Optional
 import logging
-from openai import OpenAI
 
 from src.config import config
+from src.utils.openai_client import LoopBoundOpenAI
 from .input_guardrails import GuardrailViolation
 
 logger = logging.getLogger(__name__)
@@ -13,9 +13,9 @@ logger = logging.getLogger(__name__)
 class ModerationGuardrail:
     """Uses OpenAI moderation API to check content."""
     
-    def __init__(self):
+    def __init__(self, openai: Optional[LoopBoundOpenAI] = None):
         self.enabled = config.guardrails.enable_moderation
-        self.client = OpenAI(api_key=config.openai_api_key) if self.enabled else None
+        self.openai = openai or LoopBoundOpenAI()
     
     async def check(self, content: str) -> tuple[bool, List[GuardrailViolation]]:
         """
@@ -24,11 +24,11 @@ class ModerationGuardrail:
         Returns:
             (is_safe, violations)
         """
-        if not self.enabled or not self.client:
+        if not self.enabled:
             return True, []
         
         try:
-            response = self.client.moderations.create(input=content)
+            response = await self.openai.client.moderations.create(input=content)
             result = response.results[0]
             
             violations = []
@@ -51,6 +51,6 @@ class ModerationGuardrail:
             return is_safe, violations
             
         except Exception as e:
-            logger.error(f"Moderation check failed: {e}")
+            logger.error("Moderation check failed: %s", e)
             # Fail open - allow content if moderation fails
             return True, []
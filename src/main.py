@@ -33,7 +33,7 @@ async def main():
     rewrite_agent = RewriteTailorAgent(orchestrator)
     orchestrator.register_agent(rewrite_agent)
     
-    logger.info(f"Registered agents: {orchestrator.list_agents()}")
+    logger.info("Registered agents: %s", orchestrator.list_agents())
     
     # Example: Show agent capabilities
     print("\n" + "="*50)
@@ -3,28 +3,76 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, List
 import logging
-from openai import OpenAI
+from openai import AsyncOpenAI
 
 from src.config import config
 from src.guardrails import InputGuardrails, OutputGuardrails, ModerationGuardrail
 from src.evaluation import Evaluator
+from src.utils.openai_client import LoopBoundOpenAI
 
 logger = logging.getLogger(__name__)
 
+# warmup() is best effort, so it must never hold up the calls it prepares for
+WARMUP_TIMEOUT_SECONDS = 5
+
 
 class BaseAgent(ABC):
     """Base class for all agents with guardrails and evaluation."""
     
-    def __init__(self, orchestrator: Optional[Any] = None):
+    def __init__(self, orchestrator: Optional[Any] = None, openai: Optional[LoopBoundOpenAI] = None):
+        """
+        Args:
+            orchestrator: Orchestrator to register with
+            openai: Client pool shared with other agents (e.g. one per server
+                worker). The caller owns it and closes it; without one the
+                agent opens its own pool and ``aclose()`` releases it.
+        """
         self.orchestrator = orchestrator
-        self.client = OpenAI(api_key=config.openai_api_key)
+        # Shared with the moderation and evaluation calls so every LLM call
+        # the agent makes goes through one connection pool
+        self._owns_openai = openai is None
+        self._openai = openai or LoopBoundOpenAI()
         self.model = config.agent.model
         self.input_guardrails = InputGuardrails()
         self.output_guardrails = OutputGuardrails()
-        self.moderation = ModerationGuardrail()
-        self.evaluator = Evaluator()
+        self.moderation = ModerationGuardrail(self._openai)
+        self.evaluator = Evaluator(self._openai)
         self.name = self.__class__.__name__
     
+    @property
+    def async_client(self) -> AsyncOpenAI:
+        """Async OpenAI client bound to the running event loop.
+
+        A new client is created if the agent is reused from a different loop
+        (e.g. successive ``asyncio.run`` calls), since pooled connections
+        cannot cross loops; call ``aclose()`` before each such loop ends.
+        """
+        return self._openai.client
+
+    async def aclose(self) -> None:
+        """Close the async OpenAI client opened on the running loop.
+
+        A shared client passed in at construction is left to its owner.
+        """
+        if self._owns_openai:
+            await self._openai.aclose()
+
+    async def warmup(self) -> None:
+        """Open a pooled connection to the OpenAI API ahead of the first call.
+
+        Interactive callers can schedule this as a task before prompting the
+        user so DNS/TLS setup overlaps with their typing; there is no need to
+        await it, since later calls reuse the connection once it is ready.
+        Cancel the task if it may still be running when ``aclose()`` is called.
+        The request gives up after a few seconds without retrying, and
+        failures are only logged; the real call will surface them.
+        """
+        try:
+            client = self.async_client.with_options(timeout=WARMUP_TIMEOUT_SECONDS, max_retries=0)
+            await client.models.retrieve(self.model)
+        except Exception as e:
+            logger.debug("%s warmup failed: %s", self.name, e)
+
     @abstractmethod
     async def process(self, input_data: Any, **kwargs) -> Any:
         """
@@ -41,7 +89,7 @@ class BaseAgent(ABC):
         Returns:
             Dict with 'output', 'violations', 'evaluation', etc.
         """
-        logger.info(f"{self.name} processing input")
+        logger.info("%s processing input", self.name)
         
         # Input validation
         is_valid, violations = self.input_guardrails.validate(
@@ -80,7 +128,7 @@ class BaseAgent(ABC):
         try:
             output = await self.process(input_data, **kwargs)
         except Exception as e:
-            logger.error(f"{self.name} processing failed: {e}")
+            logger.error("%s processing failed: %s", self.name, e)
             return {
                 "output": None,
                 "violations": violations,
@@ -117,7 +165,7 @@ class BaseAgent(ABC):
             "success": True
         }
         
-        logger.info(f"{self.name} completed successfully")
+        logger.info("%s completed successfully", self.name)
         return result
     
     def send_message(self, target_agent: str, message: Dict[str, Any]) -> None:
@@ -125,4 +173,4 @@ class BaseAgent(ABC):
         if self.orchestrator:
             self.orchestrator.route_message(target_agent, message, sender=self.name)
         else:
-            logger.warning(f"{self.name} has no orchestrator to route message")
+            logger.warning("%s has no orchestrator to route message", self.name)
@@ -1,6 +1,7 @@
 """Central orchestrator for coordinating all agents."""
 
 from typing import Dict, Any, Optional, List
+import asyncio
 import logging
 from collections import defaultdict
 
@@ -22,11 +23,11 @@ class CentralOrchestrator:
         """Register an agent with the orchestrator."""
         agent_name = agent.name
         if agent_name in self.agents:
-            self.logger.warning(f"Agent {agent_name} already registered, overwriting")
+            self.logger.warning("Agent %s already registered, overwriting", agent_name)
         
         self.agents[agent_name] = agent
         agent.orchestrator = self
-        self.logger.info(f"Registered agent: {agent_name}")
+        self.logger.info("Registered agent: %s", agent_name)
     
     def get_agent(self, agent_name: str) -> Optional[BaseAgent]:
         """Get a registered agent by name."""
@@ -40,7 +41,7 @@ class CentralOrchestrator:
     ) -> None:
         """Route a message to a target agent."""
         if target_agent not in self.agents:
-            self.logger.error(f"Agent {target_agent} not found")
+            self.logger.error("Agent %s not found", target_agent)
             return
         
         self.message_queue[target_agent].append({
@@ -49,7 +50,7 @@ class CentralOrchestrator:
             "timestamp": self._get_timestamp()
         })
         
-        self.logger.info(f"Routed message from {sender} to {target_agent}")
+        self.logger.info("Routed message from %s to %s", sender, target_agent)
     
     def get_messages(self, agent_name: str) -> List[Dict[str, Any]]:
         """Get queued messages for an agent."""
@@ -77,7 +78,7 @@ class CentralOrchestrator:
         Returns:
             Final workflow result
         """
-        self.logger.info(f"Executing workflow with {len(workflow)} steps")
+        self.logger.info("Executing workflow with %s steps", len(workflow))
         
         context = {"initial_input": initial_input}
         
@@ -94,13 +95,13 @@ class CentralOrchestrator:
                 # Simple template resolution
                 step_input = step_input.replace("{{previous.output}}", str(context.get("previous_output", "")))
             
-            self.logger.info(f"Step {i+1}: Executing {agent_name}")
+            self.logger.info("Step %s: Executing %s", i+1, agent_name)
             
             # Execute agent
             result = await agent.execute(step_input, **step.get("kwargs", {}))
             
             if not result["success"]:
-                self.logger.error(f"Step {i+1} failed: {result.get('error')}")
+                self.logger.error("Step %s failed: %s", i+1, result.get('error'))
                 return {
                     "success": False,
                     "error": result.get("error"),
@@ -118,6 +119,82 @@ class CentralOrchestrator:
             "context": context
         }
     
+    async def execute_dag(
+        self,
+        tasks: Dict[str, Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Execute a DAG of async tasks, starting each one as soon as its
+        dependencies have completed.
+        
+        Args:
+            tasks: Mapping of task name to definition, e.g.:
+                {
+                    "fetch_jd": {"run": fetch_jd},
+                    "analyze_jd": {"run": analyze_jd, "depends_on": ["fetch_jd"]}
+                }
+                Each ``run`` is an async callable that receives a dict of its
+                dependencies' results, keyed by task name.
+            max_concurrency: Optional cap on the number of tasks running at once
+        
+        Returns:
+            Dict mapping each task name to its result
+        
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+            Exception: The first task failure; all other running tasks are
+                cancelled and awaited before it is raised
+        """
+        for name, task in tasks.items():
+            for dep in task.get("depends_on", []):
+                if dep not in tasks:
+                    raise ValueError(f"Task {name} depends on unknown task {dep}")
+        
+        results: Dict[str, Any] = {}
+        pending = dict(tasks)
+        running: Dict[asyncio.Task, str] = {}
+        
+        try:
+            while pending or running:
+                # Refill: start every ready task up to the concurrency cap
+                ready = [
+                    name for name, task in pending.items()
+                    if all(dep in results for dep in task.get("depends_on", []))
+                ]
+                for name in ready:
+                    if max_concurrency and len(running) >= max_concurrency:
+                        break
+                    task = pending.pop(name)
+                    deps = {dep: results[dep] for dep in task.get("depends_on", [])}
+                    self.logger.info("Task started: %s", name)
+                    running[asyncio.create_task(task["run"](deps))] = name
+                
+                if not running:
+                    raise ValueError(f"Task graph has a cycle: {sorted(pending)}")
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                # Collect every finished task before raising so no exception
+                # is left unretrieved
+                error: Optional[BaseException] = None
+                for finished in done:
+                    name = running.pop(finished)
+                    try:
+                        results[name] = finished.result()
+                    except BaseException as e:
+                        error = error or e
+                        continue
+                    self.logger.info("Task completed: %s", name)
+                if error is not None:
+                    raise error
+        finally:
+            # Wait for cancelled tasks to unwind so none outlive this call
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        
+        return results
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp."""
         from datetime import datetime
@@ -126,3 +203,7 @@ class CentralOrchestrator:
     def list_agents(self) -> List[str]:
         """List all registered agents."""
         return list(self.agents.keys())
+    
+    async def aclose(self) -> None:
+        """Close the OpenAI clients every registered agent opened on this loop."""
+        await asyncio.gather(*(agent.aclose() for agent in self.agents.values()))
@@ -1,18 +1,28 @@
 """Job Description Fetcher - Fetches JD from URL using tiered extraction."""
 
+import asyncio
 import json
 import logging
 import requests
 import re
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple, Union
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
 
-# Maps domain substrings to parser method names (Tier 1 – site-specific APIs)
+# Maps domain substrings to (API-URL builder, response parser) method names
+# (Tier 1 – site-specific APIs)
 SITE_PARSERS = {
-    "greenhouse.io": "_parse_greenhouse",
-    "lever.co": "_parse_lever",
+    "greenhouse.io": ("_greenhouse_api_url", "_parse_greenhouse"),
+    "lever.co": ("_lever_api_url", "_parse_lever"),
+}
+
+EXTRACTION_FAILED = {
+    "success": False,
+    "error": (
+        "Could not extract job description from URL. "
+        "Try pasting the description directly."
+    ),
 }
 
 
@@ -23,6 +33,10 @@ class JDFetcher:
     Tier 2 – JSON-LD structured data embedded in static HTML: works for many
               company career pages and some ATS platforms.
     Tier 3 – Generic HTML text extraction: last resort for simple static pages.
+
+    ``fetch`` uses blocking ``requests``; ``fetch_async`` runs the same tiers
+    over a caller-supplied ``httpx.AsyncClient`` so it can share a connection
+    pool and never blocks the event loop.
     """
 
     def __init__(self):
@@ -46,81 +60,165 @@ class JDFetcher:
             success (bool), text (str), title (str|None),
             company (str|None), url (str), error (str – on failure only)
         """
-        if not url or not url.strip():
-            return {"success": False, "error": "URL is empty"}
+        url, error = self._validate_url(url)
+        if error:
+            return error
 
-        url = url.strip()
+        # --- Tier 1: site-specific public APIs ---------------------------
+        site = self._get_site_parser(url)
+        if site:
+            result = self._fetch_site_api(url, *site)
+            if result.get("success"):
+                logger.info("Tier-1 extraction succeeded for %s", url)
+                return result
+            logger.warning(
+                "Tier-1 parser %s failed for %s: %s",
+                site[1], url, result.get("error"),
+            )
 
+        # --- Tier 2 & 3: static HTTP fetch -------------------------------
         try:
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
-                return {"success": False, "error": "Invalid URL format"}
+            logger.info("HTTP-fetching JD from: %s", url)
+            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response.raise_for_status()
+            result = self._extract_from_html(response.text, url)
+            if result:
+                return result
+
+        except requests.exceptions.RequestException as exc:
+            logger.error("HTTP request failed for %s: %s", url, exc)
         except Exception as exc:
-            return {"success": False, "error": f"URL parsing error: {exc}"}
+            logger.error("Unexpected error processing %s: %s", url, exc)
+
+        return dict(EXTRACTION_FAILED)
+
+    async def fetch_async(self, url: str, client) -> Dict[str, Any]:
+        """Async variant of :meth:`fetch` using a shared ``httpx.AsyncClient``.
+
+        HTML parsing is CPU-bound, so it runs in a worker thread.
+        """
+        import httpx
+
+        url, error = self._validate_url(url)
+        if error:
+            return error
 
         # --- Tier 1: site-specific public APIs ---------------------------
-        parser_name = self._get_site_parser(url)
-        if parser_name:
-            result = getattr(self, parser_name)(url)
+        site = self._get_site_parser(url)
+        if site:
+            result = await self._fetch_site_api_async(url, client, *site)
             if result.get("success"):
                 logger.info("Tier-1 extraction succeeded for %s", url)
                 return result
             logger.warning(
                 "Tier-1 parser %s failed for %s: %s",
-                parser_name, url, result.get("error"),
+                site[1], url, result.get("error"),
             )
 
         # --- Tier 2 & 3: static HTTP fetch -------------------------------
         try:
             logger.info("HTTP-fetching JD from: %s", url)
-            response = requests.get(url, headers=self.headers, timeout=self.timeout)
+            response = await client.get(
+                url, headers=self.headers, timeout=self.timeout, follow_redirects=True
+            )
             response.raise_for_status()
+            result = await asyncio.to_thread(self._extract_from_html, response.text, url)
+            if result:
+                return result
 
-            # Tier 2: JSON-LD structured data
-            json_ld = self._extract_json_ld(response.text)
-            if json_ld and json_ld.get("text"):
-                logger.info("Tier-2 (JSON-LD) extraction succeeded for %s", url)
-                return {"success": True, "url": url, **json_ld}
-
-            # Tier 3: generic HTML text
-            text = self._extract_text_from_html(response.text)
-            if len(text) > 200:
-                logger.info("Tier-3 (generic HTML) extraction succeeded for %s", url)
-                return {
-                    "success": True,
-                    "text": text,
-                    "title": self._extract_job_title(response.text),
-                    "company": self._extract_company(response.text, url),
-                    "url": url,
-                }
-
-        except requests.exceptions.RequestException as exc:
+        except httpx.HTTPError as exc:
             logger.error("HTTP request failed for %s: %s", url, exc)
         except Exception as exc:
             logger.error("Unexpected error processing %s: %s", url, exc)
 
-        return {
-            "success": False,
-            "error": (
-                "Could not extract job description from URL. "
-                "Try pasting the description directly."
-            ),
-        }
+        return dict(EXTRACTION_FAILED)
+
+    def _validate_url(self, url: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Return the stripped URL and an error result if it is unusable."""
+        if not url or not url.strip():
+            return url, {"success": False, "error": "URL is empty"}
+
+        url = url.strip()
+
+        try:
+            parsed = urlparse(url)
+            if not parsed.scheme or not parsed.netloc:
+                return url, {"success": False, "error": "Invalid URL format"}
+        except Exception as exc:
+            return url, {"success": False, "error": f"URL parsing error: {exc}"}
+
+        return url, None
+
+    def _extract_from_html(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """Run Tier 2 (JSON-LD) then Tier 3 (generic HTML) over a fetched page."""
+        # Tier 2: JSON-LD structured data
+        json_ld = self._extract_json_ld(html)
+        if json_ld and json_ld.get("text"):
+            logger.info("Tier-2 (JSON-LD) extraction succeeded for %s", url)
+            return {"success": True, "url": url, **json_ld}
+
+        # Tier 3: generic HTML text
+        text = self._extract_text_from_html(html)
+        if len(text) > 200:
+            logger.info("Tier-3 (generic HTML) extraction succeeded for %s", url)
+            return {
+                "success": True,
+                "text": text,
+                "title": self._extract_job_title(html),
+                "company": self._extract_company(html, url),
+                "url": url,
+            }
+        return None
 
     # ------------------------------------------------------------------
     # Tier 1 – site-specific parsers
     # ------------------------------------------------------------------
 
-    def _get_site_parser(self, url: str) -> Optional[str]:
-        """Return the parser method name for a known job-board domain, or None."""
+    def _get_site_parser(self, url: str) -> Optional[Tuple[str, str]]:
+        """Return the (API-URL builder, parser) method names for a known
+        job-board domain, or None."""
         host = urlparse(url).netloc.lower()
-        for domain, method in SITE_PARSERS.items():
+        for domain, methods in SITE_PARSERS.items():
             if domain in host:
-                return method
+                return methods
         return None
 
-    def _parse_greenhouse(self, url: str) -> Dict[str, Any]:
-        """Fetch from the Greenhouse public JSON API (no auth required)."""
+    def _fetch_site_api(self, url: str, api_url_method: str, parser_method: str) -> Dict[str, Any]:
+        """Call a job board's public JSON API and parse the response."""
+        target = getattr(self, api_url_method)(url)
+        if isinstance(target, dict):
+            return target
+
+        api_url, company_slug = target
+        try:
+            resp = requests.get(api_url, timeout=self.timeout)
+            resp.raise_for_status()
+            return getattr(self, parser_method)(resp.json(), company_slug, url)
+        except Exception as exc:
+            logger.warning("%s failed for %s: %s", parser_method, url, exc)
+            return {"success": False, "error": str(exc)}
+
+    async def _fetch_site_api_async(
+        self, url: str, client, api_url_method: str, parser_method: str
+    ) -> Dict[str, Any]:
+        """Async variant of :meth:`_fetch_site_api`."""
+        target = getattr(self, api_url_method)(url)
+        if isinstance(target, dict):
+            return target
+
+        api_url, company_slug = target
+        try:
+            resp = await client.get(api_url, timeout=self.timeout)
+            resp.raise_for_status()
+            return await asyncio.to_thread(
+                getattr(self, parser_method), resp.json(), company_slug, url
+            )
+        except Exception as exc:
+            logger.warning("%s failed for %s: %s", parser_method, url, exc)
+            return {"success": False, "error": str(exc)}
+
+    def _greenhouse_api_url(self, url: str) -> Union[Tuple[str, str], Dict[str, Any]]:
+        """Map a Greenhouse posting URL to its public JSON API (no auth required)."""
         match = re.search(r"greenhouse\.io/([^/?#]+)/jobs/(\d+)", url)
         if not match:
             return {"success": False, "error": "Could not parse Greenhouse URL"}
@@ -129,26 +227,23 @@ class JDFetcher:
         api_url = (
             f"https://boards-api.greenhouse.io/v1/boards/{company_slug}/jobs/{job_id}"
         )
-        try:
-            resp = requests.get(api_url, timeout=self.timeout)
-            resp.raise_for_status()
-            data = resp.json()
-            from bs4 import BeautifulSoup
+        return api_url, company_slug
 
-            text = BeautifulSoup(data.get("content", ""), "html.parser").get_text()
-            return {
-                "success": True,
-                "title": data.get("title"),
-                "company": company_slug.replace("-", " ").title(),
-                "text": text,
-                "url": url,
-            }
-        except Exception as exc:
-            logger.warning("Greenhouse API failed for %s: %s", url, exc)
-            return {"success": False, "error": str(exc)}
+    def _parse_greenhouse(self, data: Dict[str, Any], company_slug: str, url: str) -> Dict[str, Any]:
+        """Build a result from a Greenhouse API response."""
+        from bs4 import BeautifulSoup
 
-    def _parse_lever(self, url: str) -> Dict[str, Any]:
-        """Fetch from the Lever public JSON API (no auth required)."""
+        text = BeautifulSoup(data.get("content", ""), "html.parser").get_text()
+        return {
+            "success": True,
+            "title": data.get("title"),
+            "company": company_slug.replace("-", " ").title(),
+            "text": text,
+            "url": url,
+        }
+
+    def _lever_api_url(self, url: str) -> Union[Tuple[str, str], Dict[str, Any]]:
+        """Map a Lever posting URL to its public JSON API (no auth required)."""
         # Lever URLs: jobs.lever.co/<company>/<uuid>
         match = re.search(
             r"lever\.co/([^/?#]+)/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})",
@@ -160,35 +255,32 @@ class JDFetcher:
 
         company_slug, job_id = match.group(1), match.group(2)
         api_url = f"https://api.lever.co/v0/postings/{company_slug}/{job_id}"
-        try:
-            resp = requests.get(api_url, timeout=self.timeout)
-            resp.raise_for_status()
-            data = resp.json()
-            from bs4 import BeautifulSoup
-
-            text_parts: list[str] = []
-            # Plain-text description (preferred)
-            if data.get("descriptionPlain"):
-                text_parts.append(data["descriptionPlain"])
-            # Structured list sections
-            for section in data.get("lists", []):
-                text_parts.append(section.get("text", ""))
-                text_parts.extend(section.get("content", []))
-            # Additional HTML sections
-            for section in data.get("additional", []):
-                text_parts.append(
-                    BeautifulSoup(section, "html.parser").get_text()
-                )
-            return {
-                "success": True,
-                "title": data.get("text"),
-                "company": company_slug.replace("-", " ").title(),
-                "text": "\n".join(filter(None, text_parts)),
-                "url": url,
-            }
-        except Exception as exc:
-            logger.warning("Lever API failed for %s: %s", url, exc)
-            return {"success": False, "error": str(exc)}
+        return api_url, company_slug
+
+    def _parse_lever(self, data: Dict[str, Any], company_slug: str, url: str) -> Dict[str, Any]:
+        """Build a result from a Lever API response."""
+        from bs4 import BeautifulSoup
+
+        text_parts: list[str] = []
+        # Plain-text description (preferred)
+        if data.get("descriptionPlain"):
+            text_parts.append(data["descriptionPlain"])
+        # Structured list sections
+        for section in data.get("lists", []):
+            text_parts.append(section.get("text", ""))
+            text_parts.extend(section.get("content", []))
+        # Additional HTML sections
+        for section in data.get("additional", []):
+            text_parts.append(
+                BeautifulSoup(section, "html.parser").get_text()
+            )
+        return {
+            "success": True,
+            "title": data.get("text"),
+            "company": company_slug.replace("-", " ").title(),
+            "text": "\n".join(filter(None, text_parts)),
+            "url": url,
+        }
 
     # ------------------------------------------------------------------
     # Tier 2 – JSON-LD structured data
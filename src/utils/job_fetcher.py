@@ -62,13 +62,13 @@ class JobFetcher:
             jobs.extend(jsearch_jobs)
         
         # Remove duplicates and filter by date
-        unique_jobs = self._deduplicate_jobs(jobs)
+        unique_jobs = self.deduplicate_jobs(jobs)
         filtered_jobs = self._filter_by_date(unique_jobs, hours_ago)
         
         # Sort by date (newest first)
         filtered_jobs.sort(key=lambda x: x.get('posted_date', ''), reverse=True)
         
-        logger.info(f"Found {len(filtered_jobs)} jobs in category '{category}' posted within {hours_ago} hours")
+        logger.info("Found %s jobs in category '%s' posted within %s hours", len(filtered_jobs), category, hours_ago)
         
         return filtered_jobs[:10]  # Limit to 10 results
 
@@ -114,7 +114,7 @@ class JobFetcher:
             
             # Check status
             if res.status != 200:
-                logger.error(f"JSearch request failed: HTTP {res.status} - {data.decode('utf-8')}")
+                logger.error("JSearch request failed: HTTP %s - %s", res.status, data.decode('utf-8'))
                 conn.close()
                 return []
             
@@ -123,7 +123,7 @@ class JobFetcher:
             conn.close()
             
         except Exception as e:
-            logger.error(f"JSearch request failed: {e}")
+            logger.error("JSearch request failed: %s", e)
             try:
                 conn.close()
             except:
@@ -144,7 +144,7 @@ class JobFetcher:
 
         return jobs
     
-    def _deduplicate_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def deduplicate_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate jobs based on URL."""
         seen_urls = set()
         unique = []
@@ -188,6 +188,6 @@ class JobFetcher:
                     return description.get_text(strip=True)
                 return response.text[:5000]  # Fallback to first 5000 chars
         except Exception as e:
-            logger.warning(f"Failed to fetch JD from {job_url}: {e}")
+            logger.warning("Failed to fetch JD from %s: %s", job_url, e)
         
         return None
@@ -33,7 +33,7 @@ class JobSearcher:
         Returns:
             Dict with 'url', 'title', 'company', 'text', 'success'
         """
-        logger.info(f"Searching for JD: {job_role} at {company_name}")
+        logger.info("Searching for JD: %s at %s", job_role, company_name)
         
         # Try common job board patterns
         search_queries = [
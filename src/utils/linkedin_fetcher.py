@@ -58,14 +58,14 @@ class LinkedInFetcher:
             # Check status
             if res.status == 200:
                 result = json.loads(data.decode("utf-8"))
-                logger.info(f"Successfully fetched LinkedIn company data for {linkedin_url}")
+                logger.info("Successfully fetched LinkedIn company data for %s", linkedin_url)
                 return result
             else:
-                logger.error(f"Failed to fetch company data: HTTP {res.status} - {data.decode('utf-8')}")
+                logger.error("Failed to fetch company data: HTTP %s - %s", res.status, data.decode('utf-8'))
                 return None
                 
         except Exception as e:
-            logger.error(f"Error fetching LinkedIn company data: {e}")
+            logger.error("Error fetching LinkedIn company data: %s", e)
             return None
         finally:
             try:
@@ -124,14 +124,14 @@ class LinkedInFetcher:
                         "avatar_url": emp.get("profile_pic_url") or emp.get("avatar_url"),
                     })
                 
-                logger.info(f"Successfully fetched {len(formatted)} employees for {linkedin_url}")
+                logger.info("Successfully fetched %s employees for %s", len(formatted), linkedin_url)
                 return formatted
             else:
-                logger.warning(f"Failed to fetch employees: HTTP {res.status}")
+                logger.warning("Failed to fetch employees: HTTP %s", res.status)
                 return []
                 
         except Exception as e:
-            logger.error(f"Error fetching LinkedIn employees: {e}")
+            logger.error("Error fetching LinkedIn employees: %s", e)
             return []
         finally:
             try:
@@ -0,0 +1,44 @@
+"""AsyncOpenAI client tied to the running event loop."""
+
+import asyncio
+import logging
+from typing import Optional
+
+from openai import AsyncOpenAI
+
+from src.config import config
+
+logger = logging.getLogger(__name__)
+
+
+class LoopBoundOpenAI:
+    """Hands out one AsyncOpenAI client per event loop.
+
+    Pooled connections cannot cross loops, so a new client is created when
+    used from a different loop (e.g. successive ``asyncio.run`` calls).
+    Callers that run their own loops should ``await aclose()`` before the
+    loop ends; once a loop is closed its connections can no longer be shut
+    down cleanly.
+    """
+
+    def __init__(self):
+        self._client: Optional[AsyncOpenAI] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def client(self) -> AsyncOpenAI:
+        """Client for the running loop, created on first use."""
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            if self._client is not None:
+                logger.warning("AsyncOpenAI client was not closed before its event loop changed")
+            self._client = AsyncOpenAI(api_key=config.openai_api_key)
+            self._loop = loop
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the client's connection pool, if one was created on this loop."""
+        client, loop = self._client, self._loop
+        self._client = self._loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
@@ -0,0 +1,149 @@
+"""Stores for results of background uploads and job applications.
+
+The API hands out an ID when it queues work and clients poll for the result.
+With a single worker an in-process store is enough; with several workers (or
+across restarts) results must live somewhere every worker can read, so a
+Redis-backed store is used when a Redis URL is configured.
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional, Set
+
+import orjson
+
+from src.utils.cache import TTLCache
+
+# Make redis optional (only needed when REDIS_URL is set)
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+class InMemoryResultStore:
+    """Result store backed by a bounded TTL cache in this process."""
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0):
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._waiters: Dict[str, Set[asyncio.Event]] = {}
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for *key*, or None if missing/expired."""
+        return self._cache.get(key)
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable result under *key* and wake its waiters."""
+        self._cache[key] = value
+        for event in self._waiters.pop(key, ()):
+            event.set()
+
+    async def wait(self, key: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Return the result for *key* once stored, or None after *timeout* seconds."""
+        result = self._cache.get(key)
+        if result is not None:
+            return result
+
+        event = asyncio.Event()
+        self._waiters.setdefault(key, set()).add(event)
+        try:
+            await asyncio.wait_for(event.wait(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            waiters = self._waiters.get(key)
+            if waiters is not None:
+                waiters.discard(event)
+                if not waiters:
+                    del self._waiters[key]
+        return self._cache.get(key)
+
+    async def delete(self, key: str) -> None:
+        """Remove *key* if present."""
+        self._cache.pop(key)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counts of the underlying cache."""
+        return self._cache.stats()
+
+    async def close(self) -> None:
+        """Release resources (nothing to do in-process)."""
+        self._cache.clear()
+
+
+class RedisResultStore:
+    """Result store shared by all workers through Redis.
+
+    Results are stored as orjson-encoded strings under ``<prefix>:<key>``
+    and expire after *ttl* seconds, matching the in-memory store. Storing a
+    result also publishes on a channel of the same name so that waiters in
+    any worker wake up.
+    """
+
+    def __init__(self, url: str, prefix: str, ttl: float = 3600.0):
+        if not REDIS_AVAILABLE:
+            raise ImportError("redis is required for RedisResultStore. Install with: pip install redis")
+        self._client = redis_asyncio.from_url(url)
+        self._prefix = prefix
+        self._ttl = int(ttl)
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored result for *key*, or None if missing/expired."""
+        raw = await self._client.get(self._key(key))
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        """Store a JSON-serializable result under *key* and wake its waiters."""
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(key), orjson.dumps(value), ex=self._ttl)
+            pipe.publish(self._key(key), b"1")
+            await pipe.execute()
+
+    async def wait(self, key: str, timeout: float) -> Optional[Dict[str, Any]]:
+        """Return the result for *key* once stored, or None after *timeout* seconds."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        async with self._client.pubsub() as pubsub:
+            # Subscribe before checking so a result stored in between is not missed
+            await pubsub.subscribe(self._key(key))
+            result = await self.get(key)
+            while result is None:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=remaining)
+                if message is not None:
+                    result = await self.get(key)
+            return result
+
+    async def delete(self, key: str) -> None:
+        """Remove *key* if present."""
+        await self._client.delete(self._key(key))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the backend in use (sizes and hit rates live in Redis INFO)."""
+        return {"backend": "redis"}
+
+    async def close(self) -> None:
+        """Close the Redis connection pool."""
+        await self._client.aclose()
+
+
+def create_result_store(
+    prefix: str,
+    redis_url: Optional[str] = None,
+    maxsize: int = 10_000,
+    ttl: float = 3600.0,
+):
+    """Return a Redis-backed store if *redis_url* is set, else an in-memory one."""
+    if redis_url:
+        logger.info("Storing %s results in Redis", prefix)
+        return RedisResultStore(redis_url, prefix=prefix, ttl=ttl)
+    return InMemoryResultStore(maxsize=maxsize, ttl=ttl)
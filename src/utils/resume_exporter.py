@@ -1,5 +1,6 @@
 """Resume exporter - Converts Profile to DOCX/PDF."""
 
+import io
 import logging
 from pathlib import Path
 from typing import Optional
@@ -29,6 +30,28 @@ class ResumeExporter:
         Returns:
             Path to saved file
         """
+        doc = self._build_document(profile)
+        doc.save(output_path)
+        logger.info("Resume exported to %s", output_path)
+        
+        return output_path
+    
+    def export_to_bytes(self, profile: Profile) -> bytes:
+        """
+        Export profile to DOCX in memory.
+        
+        Args:
+            profile: Profile to export
+        
+        Returns:
+            DOCX file contents
+        """
+        buffer = io.BytesIO()
+        self._build_document(profile).save(buffer)
+        return buffer.getvalue()
+    
+    def _build_document(self, profile: Profile):
+        """Build the DOCX document for a profile."""
         doc = docx.Document()
         
         # Set up styles
@@ -150,11 +173,7 @@ class ResumeExporter:
                 
                 doc.add_paragraph()  # Spacing
         
-        # Save document
-        doc.save(output_path)
-        logger.info(f"Resume exported to {output_path}")
-        
-        return output_path
+        return doc
     
     def _setup_styles(self, doc):
         """Set up document styles."""
@@ -0,0 +1,300 @@
+"""Tests for the backend API request contracts."""
+
+import asyncio
+import os
+import socket
+import tempfile
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+from backend.main import app
+from src.utils.result_store import InMemoryResultStore
+
+
+PROFILE = {
+    "name": "Ada Lovelace",
+    "skills": [{"name": "Python"}],
+    "experiences": [{"title": "Engineer", "company": "Analytical Engines"}],
+}
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Create a test client with the app lifespan running."""
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_linkedin_message_uses_defaults_for_missing_job_fields(client):
+    """Test that a job without title/company falls back to the default wording."""
+    response = client.post(
+        "/api/linkedin/generate-message",
+        json={"job": {"url": "https://example.com/jobs/1"}, "profile": PROFILE},
+    )
+
+    assert response.status_code == 200
+    message = response.json()["message"]
+    assert "this position" in message
+    assert "your company" in message
+
+
+@pytest.mark.parametrize("tone", ["sarcastic", [], {"a": 1}, 3])
+def test_linkedin_message_unknown_tone_uses_concise_template(client, tone):
+    """Test that unrecognized tones of any type fall back to the concise template."""
+    response = client.post(
+        "/api/linkedin/generate-message",
+        json={"job": {"title": "Engineer"}, "profile": PROFILE, "tone": tone},
+    )
+    concise = client.post(
+        "/api/linkedin/generate-message",
+        json={"job": {"title": "Engineer"}, "profile": PROFILE, "tone": "concise"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["message"] == concise.json()["message"]
+
+
+def test_linkedin_message_formats_non_string_job_fields(client):
+    """Test that a numeric title is formatted into the message."""
+    response = client.post(
+        "/api/linkedin/generate-message",
+        json={"job": {"title": 123, "company": "Acme"}, "profile": PROFILE},
+    )
+
+    assert response.status_code == 200
+    assert "123" in response.json()["message"]
+
+
+@pytest.mark.parametrize("payload", [
+    {"job": {"title": "Engineer"}, "profile": None},
+    {"job": {"title": "Engineer"}},
+    {"job": {}, "profile": PROFILE},
+    {"profile": PROFILE},
+])
+def test_linkedin_message_requires_job_and_profile(client, payload):
+    """Test that missing, null or empty job/profile data is a 400."""
+    response = client.post("/api/linkedin/generate-message", json=payload)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Job and profile data required"
+
+
+@pytest.mark.parametrize("payload", [{}, {"job": None}, {"job": {}}])
+def test_interview_prep_requires_job(client, payload):
+    """Test that missing, null or empty job data is a 400."""
+    response = client.post("/api/interview/prep-plan", json=payload)
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Job data required"
+
+
+def test_interview_prep_returns_plan(client):
+    """Test that any non-empty job gets the prep plan."""
+    response = client.post("/api/interview/prep-plan", json={"job": {"title": "Engineer"}})
+
+    assert response.status_code == 200
+    assert response.json()["success"] is True
+
+
+def test_linkedin_message_reuses_cached_profile(client):
+    """Test that a repeat profile skips validation via the profile cache."""
+    payload = {"job": {"title": "Engineer"}, "profile": PROFILE}
+    client.post("/api/linkedin/generate-message", json=payload)
+    hits = client.get("/metrics").json()["profiles"]["hits"]
+
+    response = client.post("/api/linkedin/generate-message", json=payload)
+
+    assert response.status_code == 200
+    assert client.get("/metrics").json()["profiles"]["hits"] == hits + 1
+
+
+@pytest.mark.asyncio
+async def test_job_result_stream_sends_processing_then_done(monkeypatch):
+    """Test that the SSE route heartbeats while pending, then pushes the result."""
+    store = InMemoryResultStore(maxsize=8, ttl=60)
+    monkeypatch.setattr(app.state, "job_results", store, raising=False)
+    monkeypatch.setattr(main, "JOB_STREAM_HEARTBEAT_SECONDS", 0.01)
+
+    async def finish_later():
+        await asyncio.sleep(0.05)
+        await store.set("job-1", {"success": True, "job_id": "job-1"})
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as http:
+        finisher = asyncio.create_task(finish_later())
+        response = await http.get(
+            "/api/jobs/apply/job-1/stream", headers={"Accept-Encoding": "gzip"}
+        )
+        await finisher
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "identity"
+    events = [chunk for chunk in response.text.split("\n\n") if chunk]
+    assert events[0] == "event: processing\ndata: {}"
+    assert events[-1] == 'event: done\ndata: {"success":true,"job_id":"job-1"}'
+    assert await store.get("job-1") is None
+
+
+def _resolve_to(address):
+    """Fake getaddrinfo that resolves every host to *address*."""
+    def getaddrinfo(host, port, *args, **kwargs):
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port))]
+    return getaddrinfo
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("url", [
+    "file:///etc/passwd",
+    "ftp://example.com/audio.wav",
+    "http://127.0.0.1/audio.wav",
+    "http://10.0.0.5/audio.wav",
+    "http://[::1]/audio.wav",
+    "http://169.254.169.254/latest/meta-data",
+])
+async def test_check_public_url_rejects_non_public_urls(url):
+    """Test that non-http schemes and loopback/private/link-local IPs are rejected."""
+    with pytest.raises(ValueError):
+        await main._check_public_url(url)
+
+
+@pytest.mark.asyncio
+async def test_check_public_url_rejects_hosts_resolving_to_loopback(monkeypatch):
+    """Test that a public-looking hostname resolving to 127.0.0.1 is rejected."""
+    monkeypatch.setattr(socket, "getaddrinfo", _resolve_to("127.0.0.1"))
+
+    with pytest.raises(ValueError, match="public host"):
+        await main._check_public_url("http://audio.example.com/clip.wav")
+
+
+@pytest.mark.asyncio
+async def test_download_connects_to_the_vetted_address(monkeypatch):
+    """Test that the download uses the checked IP with the original Host and SNI."""
+    monkeypatch.setattr(socket, "getaddrinfo", _resolve_to("93.184.216.34"))
+    seen = []
+
+    def handler(request):
+        seen.append(request)
+        return httpx.Response(200, content=b"RIFF")
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        path = await main._download_to_tempfile("https://audio.example.com:8443/clip.mp3", http)
+
+    try:
+        with open(path, "rb") as f:
+            assert f.read() == b"RIFF"
+    finally:
+        os.unlink(path)
+    assert path.endswith(".mp3")
+    assert str(seen[0].url) == "https://93.184.216.34:8443/clip.mp3"
+    assert seen[0].headers["host"] == "audio.example.com:8443"
+    assert seen[0].extensions["sni_hostname"] == "audio.example.com"
+
+
+def test_job_search_honours_if_none_match(client, monkeypatch):
+    """Test that a matching ETag gets a bodiless 304 and a stale one gets a 200."""
+    jobs = [{"job_id": "1", "title": "Engineer", "company": "Acme"}]
+    monkeypatch.setattr(app.state.job_fetcher, "search_jobs", lambda **kwargs: jobs)
+    payload = {"category": "software"}
+
+    first = client.post("/api/jobs/search", json=payload)
+    etag = first.headers["etag"]
+    cached = client.post("/api/jobs/search", json=payload, headers={"If-None-Match": etag})
+    stale = client.post("/api/jobs/search", json=payload, headers={"If-None-Match": '"stale"'})
+
+    assert first.status_code == 200
+    assert first.json()["jobs"] == jobs
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["etag"] == etag
+    assert stale.status_code == 200
+    assert stale.json() == first.json()
+
+
+def test_upload_rejects_oversize_content_length(client, monkeypatch):
+    """Test that the middleware answers 413 from Content-Length alone."""
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 1024)
+
+    response = client.post(
+        "/api/resume/upload", files={"file": ("resume.pdf", b"x" * 4096, "application/pdf")}
+    )
+
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Request body too large"
+
+
+def test_upload_rejects_oversize_chunked_body_and_removes_temp_file(client, monkeypatch, tmp_path):
+    """Test that a chunked upload without Content-Length is cut off at the limit."""
+    monkeypatch.setattr(main, "MAX_UPLOAD_BYTES", 1024)
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    boundary = "resume-boundary"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="file"; filename="resume.pdf"\r\n'
+        "Content-Type: application/pdf\r\n\r\n"
+    ).encode() + b"x" * 4096 + f"\r\n--{boundary}--\r\n".encode()
+
+    response = client.post(
+        "/api/resume/upload",
+        content=iter([body]),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    assert response.status_code == 413
+    assert response.json()["detail"] == "Resume file too large"
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_work_and_survives_cancelled_waiters():
+    """Test that concurrent callers share one run and a cancelled waiter doesn't stop it."""
+    inflight = {}
+    release = asyncio.Event()
+    calls = []
+
+    async def fetch():
+        calls.append(len(calls))
+        await release.wait()
+        return len(calls)
+
+    async def caller():
+        return await asyncio.shield(main._single_flight(inflight, "url", fetch))
+
+    cancelled = asyncio.create_task(caller())
+    waiting = asyncio.create_task(caller())
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await waiting == 1
+    assert cancelled.cancelled()
+    assert calls == [0]
+    assert inflight == {}
+    assert await caller() == 2
+    assert inflight == {}
+
+
+def test_job_result_poll_is_202_until_done_then_returned_once(client):
+    """Test that a pending job polls as an empty 202 and a result is served once."""
+    pending = client.get("/api/jobs/apply/job-poll")
+
+    client.portal.call(app.state.job_results.set, "job-poll", {"success": True, "job_id": "job-poll"})
+    done = client.get("/api/jobs/apply/job-poll")
+    again = client.get("/api/jobs/apply/job-poll")
+
+    assert pending.status_code == 202
+    assert pending.content == b""
+    assert done.status_code == 200
+    assert done.json() == {"success": True, "job_id": "job-poll"}
+    assert again.status_code == 202
+
+
+@pytest.mark.parametrize("company", ["JPMorgan Chase & Co.", "JPMorgan Chase", "J.P. Morgan"])
+def test_linkedin_employees_match_jpmorgan_variants(company):
+    """Test that '& Co.' is stripped so the legal name finds the JPMorgan employees."""
+    assert main._normalize_company_name("JPMorgan Chase & Co.") == "JPMorgan Chase"
+    assert main.fetch_linkedin_employees(company) == main.fetch_linkedin_employees("jpmorgan")
+    assert len(main.fetch_linkedin_employees(company)) == 5
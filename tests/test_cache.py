@@ -0,0 +1,53 @@
+"""Tests for the TTL cache utility."""
+
+import pytest
+from unittest.mock import patch
+
+from src.utils.cache import TTLCache
+
+
+def test_set_and_get():
+    """Test basic insert and lookup."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+
+    assert cache.get("a") == 1
+    assert cache["a"] == 1
+    assert "a" in cache
+    assert cache.get("missing") is None
+
+
+def test_evicts_least_recently_used():
+    """Test that the oldest untouched entry is evicted when full."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache["b"] = 2
+    cache.get("a")
+    cache["c"] = 3
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_entries_expire():
+    """Test that entries are dropped once their TTL has passed."""
+    cache = TTLCache(maxsize=2, ttl=10)
+    with patch("src.utils.cache.time.monotonic", return_value=100.0):
+        cache["a"] = 1
+    with patch("src.utils.cache.time.monotonic", return_value=111.0):
+        assert cache.get("a") is None
+        assert "a" not in cache
+        with pytest.raises(KeyError):
+            cache["a"]
+
+
+def test_stats_count_hits_and_misses():
+    """Test that get() lookups are reflected in stats()."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache["a"] = 1
+    cache.get("a")
+    cache.get("b")
+
+    assert cache.stats() == {"size": 1, "maxsize": 2, "hits": 1, "misses": 1}
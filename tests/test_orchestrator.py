@@ -0,0 +1,103 @@
+"""Tests for the Central Orchestrator."""
+
+import asyncio
+import pytest
+
+from src.orchestrator.central_orchestrator import CentralOrchestrator
+
+
+@pytest.fixture
+def orchestrator():
+    """Create a test orchestrator."""
+    return CentralOrchestrator()
+
+
+@pytest.mark.asyncio
+async def test_execute_dag_passes_dependency_results(orchestrator):
+    """Test that each task receives its dependencies' results."""
+    async def fetch(deps):
+        return "jd text"
+
+    async def analyze(deps):
+        return deps["fetch"].upper()
+
+    results = await orchestrator.execute_dag({
+        "analyze": {"run": analyze, "depends_on": ["fetch"]},
+        "fetch": {"run": fetch},
+    })
+
+    assert results == {"fetch": "jd text", "analyze": "JD TEXT"}
+
+
+@pytest.mark.asyncio
+async def test_execute_dag_runs_independent_tasks_concurrently(orchestrator):
+    """Test that tasks without dependencies between them overlap."""
+    running = set()
+    overlapped = []
+
+    async def track(name):
+        running.add(name)
+        await asyncio.sleep(0.01)
+        overlapped.append(len(running) > 1)
+        running.discard(name)
+        return name
+
+    results = await orchestrator.execute_dag({
+        "profile": {"run": lambda deps: track("profile")},
+        "jd": {"run": lambda deps: track("jd")},
+    })
+
+    assert results == {"profile": "profile", "jd": "jd"}
+    assert any(overlapped)
+
+
+@pytest.mark.asyncio
+async def test_execute_dag_rejects_cycles(orchestrator):
+    """Test that a cyclic task graph raises instead of hanging."""
+    async def noop(deps):
+        return None
+
+    with pytest.raises(ValueError):
+        await orchestrator.execute_dag({
+            "a": {"run": noop, "depends_on": ["b"]},
+            "b": {"run": noop, "depends_on": ["a"]},
+        })
+
+
+@pytest.mark.asyncio
+async def test_execute_dag_propagates_failures(orchestrator):
+    """Test that a failing task raises and cancels the rest."""
+    async def fail(deps):
+        raise RuntimeError("boom")
+
+    async def slow(deps):
+        await asyncio.sleep(10)
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.execute_dag({
+            "fail": {"run": fail},
+            "slow": {"run": slow},
+        })
+
+
+@pytest.mark.asyncio
+async def test_execute_dag_waits_for_cancelled_tasks(orchestrator):
+    """Test that running tasks have finished unwinding when a failure is raised."""
+    unwound = []
+
+    async def fail(deps):
+        raise RuntimeError("boom")
+
+    async def slow(deps):
+        try:
+            await asyncio.sleep(10)
+        finally:
+            unwound.append("slow")
+
+    with pytest.raises(RuntimeError):
+        await orchestrator.execute_dag({
+            "fail": {"run": fail},
+            "slow": {"run": slow},
+        })
+
+    assert unwound == ["slow"]
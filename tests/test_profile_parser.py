@@ -128,7 +128,7 @@ def test_resume_parser_docx():
 @pytest.mark.asyncio
 async def test_profile_parser_extract_structured_data(profile_agent, sample_resume_text):
     """Test structured data extraction."""
-    with patch.object(profile_agent.client.chat.completions, 'create') as mock_create:
+    with patch.object(profile_agent.async_client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
         mock_response = Mock()
         mock_response.choices = [Mock()]
         mock_response.choices[0].message.content = json.dumps({
@@ -0,0 +1,38 @@
+"""Tests for the job/upload result stores."""
+
+import asyncio
+import pytest
+
+from src.utils.result_store import InMemoryResultStore, create_result_store
+
+
+@pytest.mark.asyncio
+async def test_in_memory_set_get_delete():
+    """Test storing, reading and removing a result."""
+    store = InMemoryResultStore(maxsize=2, ttl=60)
+    assert await store.get("job") is None
+
+    await store.set("job", {"success": True})
+    assert await store.get("job") == {"success": True}
+
+    await store.delete("job")
+    await store.delete("job")
+    assert await store.get("job") is None
+
+
+def test_factory_defaults_to_in_memory():
+    """Test that no Redis URL gives an in-process store."""
+    assert isinstance(create_result_store("job_results"), InMemoryResultStore)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_wait_wakes_on_set():
+    """Test that a waiter is woken by set and that a timeout returns None."""
+    store = InMemoryResultStore(maxsize=2, ttl=60)
+    waiter = asyncio.ensure_future(store.wait("job", timeout=5))
+    await asyncio.sleep(0)
+    await store.set("job", {"success": True})
+
+    assert await waiter == {"success": True}
+    assert await store.wait("missing", timeout=0.01) is None
+    assert store._waiters == {}
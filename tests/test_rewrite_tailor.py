@@ -0,0 +1,98 @@
+"""Tests for Rewrite & Tailor Agent."""
+
+import asyncio
+
+import pytest
+
+from src.agents.rewrite_tailor import RewriteTailorAgent
+from src.agents.profile_parser.profile_models import Profile, Skill
+from src.orchestrator.central_orchestrator import CentralOrchestrator
+from src.utils.openai_client import LoopBoundOpenAI
+
+
+@pytest.fixture
+def rewrite_agent():
+    """Create a test rewrite agent."""
+    return RewriteTailorAgent(CentralOrchestrator())
+
+
+@pytest.fixture
+def sample_profile():
+    """Profile with every section the rewrite agent edits."""
+    return Profile(
+        name="Jane Doe",
+        summary="Engineer",
+        experiences=[{"title": "SWE", "bullets": ["Built APIs"], "technologies": ["Python"]}],
+        projects=[{"name": "Tool", "bullets": ["Wrote CLI"]}],
+        skills=[{"name": "Python"}],
+        education=[{"degree": "BS"}],
+        other_sections=[{"name": "Leadership", "items": [{"description": "Led club"}]}],
+    )
+
+
+def test_copy_for_editing_isolates_edited_sections(rewrite_agent, sample_profile):
+    """Test that edits to the copy never leak into the original profile."""
+    edited = rewrite_agent._copy_for_editing(sample_profile)
+    edited.summary = "Senior engineer"
+    edited.experiences[0].bullets[0] = "Built fast APIs"
+    edited.experiences[0].technologies.append("Go")
+    edited.projects[0].bullets.append("Added tests")
+    edited.skills.append(Skill(name="Go"))
+    edited.other_sections[0].items[0]["description"] = "Led large club"
+
+    assert sample_profile.summary == "Engineer"
+    assert sample_profile.experiences[0].bullets == ["Built APIs"]
+    assert sample_profile.experiences[0].technologies == ["Python"]
+    assert sample_profile.projects[0].bullets == ["Wrote CLI"]
+    assert [s.name for s in sample_profile.skills] == ["Python"]
+    assert sample_profile.other_sections[0].items[0]["description"] == "Led club"
+
+
+def test_copy_for_editing_shares_untouched_sections(rewrite_agent, sample_profile):
+    """Test that sections the agent never edits are shared, not copied."""
+    edited = rewrite_agent._copy_for_editing(sample_profile)
+
+    assert edited.education is sample_profile.education
+    assert edited.skills[0] is sample_profile.skills[0]
+
+
+def test_async_client_is_per_event_loop(rewrite_agent):
+    """Test that the async client is reused within a loop and rebuilt across loops."""
+    async def get_clients():
+        clients = rewrite_agent.async_client, rewrite_agent.async_client
+        await rewrite_agent.aclose()
+        return clients
+
+    first, same = asyncio.run(get_clients())
+    second, _ = asyncio.run(get_clients())
+
+    assert first is same
+    assert first is not second
+
+
+def test_aclose_closes_async_client(rewrite_agent):
+    """Test that aclose() closes the client opened on the running loop."""
+    async def open_and_close():
+        client = rewrite_agent.async_client
+        await rewrite_agent.aclose()
+        return client
+
+    client = asyncio.run(open_and_close())
+
+    assert client.is_closed()
+
+
+@pytest.mark.asyncio
+async def test_shared_async_client_is_left_to_its_owner():
+    """Test that agents share an injected client and aclose() leaves it open."""
+    openai = LoopBoundOpenAI()
+    first = RewriteTailorAgent(CentralOrchestrator(), openai=openai)
+    second = RewriteTailorAgent(CentralOrchestrator(), openai=openai)
+    client = first.async_client
+
+    await first.aclose()
+
+    assert second.async_client is client
+    assert not client.is_closed()
+    await openai.aclose()
+    assert client.is_closed()
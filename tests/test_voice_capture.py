@@ -32,7 +32,7 @@ async def test_parse_instructions(voice_agent):
     """Test instruction parsing."""
     transcription = "Focus on distributed systems and my volunteer coordination system, downplay coursework."
     
-    with patch.object(voice_agent.client.chat.completions, 'create') as mock_create:
+    with patch.object(voice_agent.async_client.chat.completions, 'create', new_callable=AsyncMock) as mock_create:
         mock_response = Mock()
         mock_response.choices = [Mock()]
         mock_response.choices[0].message.content = '{"intent": "Focus on distributed systems", "constraints": ["downplay coursework"]}'
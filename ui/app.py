@@ -301,6 +301,16 @@ def save_uploaded_file(uploaded_file, prefix="file"):
     return str(file_path)
 
 
+def run_async(coro):
+    """Run *coro* on a fresh event loop, closing the agents' OpenAI clients before it ends."""
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await st.session_state.orchestrator.aclose()
+    return asyncio.run(runner())
+
+
 async def process_resume_async(file_path):
     """Process resume asynchronously."""
     result = await st.session_state.profile_agent.parse_resume(file_path)
@@ -478,7 +488,7 @@ with left_col:
     if uploaded_resume is not None and not st.session_state.resume_uploaded:
         with st.spinner("Processing resume..."):
             file_path = save_uploaded_file(uploaded_resume, "resume")
-            result = asyncio.run(process_resume_async(file_path))
+            result = run_async(process_resume_async(file_path))
             
             if result["success"]:
                 profile = result["profile"]
@@ -594,7 +604,7 @@ with right_col:
         if current_job.get('status') == 'queued':
             current_job['status'] = 'processing'
             with st.spinner("Customizing resume for this job..."):
-                edited_profile, jd_analysis = asyncio.run(process_job_application(current_job))
+                edited_profile, jd_analysis = run_async(process_job_application(current_job))
                 
                 if edited_profile:
                     st.session_state.edited_profile = edited_profile
@@ -627,18 +637,17 @@ with right_col:
             with col2:
                 exporter = ResumeExporter()
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_path = UPLOADS_DIR / f"resume_{timestamp}.docx"
                 
                 try:
-                    exporter.export_to_docx(profile, str(output_path))
-                    with open(output_path, "rb") as f:
-                        st.download_button(
-                            "📥 Download",
-                            f.read(),
-                            file_name=f"resume_{current_job.get('company', 'job')}_{timestamp}.docx",
-                            mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                            use_container_width=True
-                        )
+                    # Built in memory: this runs on every rerun, so writing to
+                    # UPLOADS_DIR would leave a new file behind each time
+                    st.download_button(
+                        "📥 Download",
+                        exporter.export_to_bytes(profile),
+                        file_name=f"resume_{current_job.get('company', 'job')}_{timestamp}.docx",
+                        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+                        use_container_width=True
+                    )
                 except Exception as e:
                     st.error(f"Export failed: {e}")
             